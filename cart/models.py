@@ -5,7 +5,7 @@ from typing import Optional, Tuple
 
 from django.conf import settings
 from django.db import models
-from django.db.models import Q
+from django.db.models import DecimalField, F, Q, Sum
 
 from store.models import Product
 from users.models import AuthUser
@@ -81,12 +81,25 @@ class Cart(models.Model):
     def get_total_price(self) -> Decimal:
         """
         Calculate the total price of all items in the cart.
+        Uses prefetched items when available, otherwise lets the database
+        aggregate quantity * price in a single query.
         Returns:
         Decimal: The total cost of all cart items.
         """
-        return sum(
-            (item.get_total_price() for item in self.items.all()), Decimal("0.0")
-        )
+        prefetched_items = getattr(self, "_prefetched_objects_cache", {}).get("items")
+
+        if prefetched_items is not None:
+            return sum(
+                (item.get_total_price() for item in prefetched_items), Decimal("0.0")
+            )
+
+        total = self.items.aggregate(
+            total=Sum(
+                F("quantity") * F("product__price"),
+                output_field=DecimalField(max_digits=12, decimal_places=2),
+            )
+        )["total"]
+        return total or Decimal("0.0")
 
     @staticmethod
     def get_user_active_cart_or_create(user: AuthUser) -> Tuple["Cart", bool]:
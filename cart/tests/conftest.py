@@ -4,7 +4,6 @@ import logging.config
 import factory
 import pytest
 from django.conf import settings
-from rest_framework.test import APIClient
 
 from ..models import Cart, CartItem
 
@@ -14,14 +13,6 @@ def configure_logging():
     logging.config.dictConfig(settings.LOGGING)
 
 
-@pytest.fixture
-def api_client():
-    """
-    Api client fixture.
-    """
-    return APIClient()
-
-
 class CartFactory(factory.django.DjangoModelFactory):
     """
     Factory for creating Cart instances.
@@ -0,0 +1,47 @@
+import pytest
+from django.test import override_settings
+from rest_framework.test import APIClient
+
+
+@pytest.fixture(autouse=True, scope="session")
+def fast_password_hasher():
+    """
+    Hash test passwords with MD5. The default PBKDF2 hasher is deliberately
+    slow, which only costs time when every test creates users.
+    """
+    with override_settings(
+        PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+    ):
+        yield
+
+
+@pytest.fixture(autouse=True, scope="session")
+def cookie_sessions():
+    """
+    Keep test client sessions in signed cookies. APIClient.logout() creates
+    and saves a session, which with the database backend would be an extra
+    write per test and would need database access in every test.
+    """
+    with override_settings(
+        SESSION_ENGINE="django.contrib.sessions.backends.signed_cookies"
+    ):
+        yield
+
+
+@pytest.fixture(scope="session")
+def api_client() -> APIClient:
+    """
+    Api client fixture, shared by the whole test session.
+    """
+    return APIClient()
+
+
+@pytest.fixture(autouse=True)
+def reset_api_client(api_client: APIClient) -> None:
+    """
+    Drop credentials, forced authentication and cookies left on the shared
+    client by the previous test.
+    """
+    api_client.credentials()
+    api_client.cookies.clear()
+    api_client.force_authenticate(user=None)
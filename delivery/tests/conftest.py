@@ -3,19 +3,10 @@ from random import randint
 import factory
 import pytest
 from django.conf import settings
-from rest_framework.test import APIClient
 
 from ..models import Area, City, DeliveryAddress
 
 
-@pytest.fixture
-def api_client():
-    """
-    Api client fixture.
-    """
-    return APIClient()
-
-
 class AreaFactory(factory.django.DjangoModelFactory):
     """
     Factory for creating Area instances.
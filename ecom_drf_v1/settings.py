@@ -112,45 +112,59 @@ AUTH_PASSWORD_VALIDATORS = [
 
 AUTH_USER_MODEL = "users.AuthUser"
 
-LOGGING = {
-    "version": 1,
-    "disable_existing_loggers": False,
-    "formatters": {
-        "verbose": {"format": "%(levelname)s %(asctime)s %(module)s %(message)s"},
-        "simple": {"format": "%(levelname)s %(message)s"},
-    },
-    "handlers": {
-        "file": {
-            "level": "DEBUG",
-            "class": "logging.FileHandler",
-            "filename": BASE_DIR / "drf.log",
-            "formatter": "verbose",
-        },
-        "console": {
-            "level": "DEBUG",
-            "class": "logging.StreamHandler",
-            "formatter": "verbose",
-        },
-    },
-    "root": {"handlers": ["console", "file"], "level": "DEBUG"},
-    "loggers": {
-        "django": {
-            "handlers": ["console", "file"],
-            "level": "INFO",
-            "propagate": False,
+
+def build_logging(debug: bool) -> dict:
+    """
+    Builds the LOGGING config once at import time.
+
+    Outside of DEBUG the root and django loggers are raised to WARNING, so SQL
+    statements and debug records are not formatted on every request.
+    """
+    root_level = "DEBUG" if debug else "WARNING"
+    django_level = "INFO" if debug else "WARNING"
+
+    return {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "formatters": {
+            "verbose": {"format": "%(levelname)s %(asctime)s %(module)s %(message)s"},
+            "simple": {"format": "%(levelname)s %(message)s"},
         },
-        "project": {
-            "handlers": ["console", "file"],
-            "level": "DEBUG",
-            "propagate": True,
+        "handlers": {
+            "file": {
+                "level": "DEBUG",
+                "class": "logging.FileHandler",
+                "filename": BASE_DIR / "drf.log",
+                "formatter": "verbose",
+            },
+            "console": {
+                "level": "DEBUG",
+                "class": "logging.StreamHandler",
+                "formatter": "verbose",
+            },
         },
-        "django.db.backends": {
-            "level": "INFO",
-            "handlers": ["console", "file"],
-            "propagate": False,
+        "root": {"handlers": ["console", "file"], "level": root_level},
+        "loggers": {
+            "django": {
+                "handlers": ["console", "file"],
+                "level": django_level,
+                "propagate": False,
+            },
+            "project": {
+                "handlers": ["console", "file"],
+                "level": "DEBUG",
+                "propagate": True,
+            },
+            "django.db.backends": {
+                "level": django_level,
+                "handlers": ["console", "file"],
+                "propagate": False,
+            },
         },
-    },
-}
+    }
+
+
+LOGGING = build_logging(DEBUG)
 
 LANGUAGE_CODE = "en-us"
 
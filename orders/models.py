@@ -3,6 +3,7 @@ from typing import Optional
 
 from django.conf import settings
 from django.db import models
+from django.db.models import DecimalField, F, Sum
 
 from store.models import Product
 
@@ -44,17 +45,40 @@ class Order(models.Model):
     class Meta:
         verbose_name = "Order"
         verbose_name_plural = "Orders"
+        indexes = [
+            models.Index(fields=["status", "id"], name="idx_order_status_id"),
+        ]
 
     def get_total_price(self) -> Decimal:
         """
         Calculates the total price of all items in the order.
+        Uses prefetched items when available, otherwise lets the database
+        aggregate quantity * price in a single query.
         Returns:
             Decimal: The total cost of all order items.
         """
-        return sum(
-            (item.get_total_price() for item in self.items.all()), Decimal("0.0")
+        prefetched_items = getattr(self, "_prefetched_objects_cache", {}).get("items")
+
+        if prefetched_items is None:
+            total = self.items.aggregate(
+                total=Sum(
+                    F("quantity") * F("product__price"),
+                    output_field=DecimalField(max_digits=12, decimal_places=2),
+                )
+            )["total"]
+            return total or Decimal("0.0")
+
+        rows = (
+            (item.quantity, item.product.price if item.product else None)
+            for item in prefetched_items
         )
 
+        total = Decimal("0.0")
+        for quantity, price in rows:
+            if price is not None:
+                total += price * quantity
+        return total
+
 
 class OrderItem(models.Model):
     order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name="items")
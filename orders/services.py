@@ -1,10 +1,10 @@
 import logging
 
 from django.db import transaction
-from django.db.models import Prefetch
+from django.db.models import Count
 from rest_framework.exceptions import ValidationError
 
-from cart.models import Cart, CartItem
+from cart.models import Cart
 from delivery.factory import DeliveryFactory
 from delivery.models import DeliveryAddress
 from orders.models import Order, OrderItem
@@ -21,17 +21,24 @@ class OrderService:
         Process the checkout of an active cart and create an order.
         """
 
-        cart: Cart = (
+        cart: Cart | None = (
             Cart.objects.filter(user=user, status="active")
-            .prefetch_related(
-                Prefetch("items", queryset=CartItem.objects.select_related("product"))
-            )
+            .annotate(n_items=Count("items"))
             .first()
         )
 
-        if not cart or not cart.items.exists():
+        if cart is None or cart.n_items == 0:
             raise ValidationError("Cart is empty or doesn't exist")
 
+        try:
+            address = DeliveryAddress.objects.get(
+                id=delivery_address_id, is_active=True
+            )
+        except DeliveryAddress.DoesNotExist:
+            raise ValidationError(
+                f"DeliveryAddress with ID {delivery_address_id} not found"
+            )
+
         order: Order = Order.objects.create(user=user, status="pending")
 
         order_items: list[OrderItem] = [
@@ -40,22 +47,13 @@ class OrderService:
                 product=item.product,
                 quantity=item.quantity,
             )
-            for item in cart.items.all()
+            for item in cart.items.select_related("product")
         ]
 
-        OrderItem.objects.bulk_create(order_items)
+        OrderItem.objects.bulk_create(order_items, batch_size=500)
         cart.status = "ordered"
         cart.save()
 
-        try:
-            address = DeliveryAddress.objects.get(
-                id=delivery_address_id, is_active=True
-            )
-        except DeliveryAddress.DoesNotExist:
-            raise ValidationError(
-                f"DeliveryAddress with ID {delivery_address_id} not found"
-            )
-
         gateway = DeliveryFactory.create_gateway(address.carrier)
         gateway.create_shipment(order, address)
 
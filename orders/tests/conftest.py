@@ -4,7 +4,11 @@ import logging.config
 import factory
 import pytest
 from django.conf import settings
-from rest_framework.test import APIClient
+
+from store.tests.conftest import (CategoryFactory, IndustryFactory,
+                                  ProductTypeFactory, VendorFactory,
+                                  create_product)
+from users.tests.conftest import create_user
 
 from ..models import Order, OrderItem
 
@@ -14,12 +18,50 @@ def configure_logging():
     logging.config.dictConfig(settings.LOGGING)
 
 
+@pytest.fixture(scope="module")
+def catalog(django_db_setup, django_db_blocker):
+    """
+    Creates the category, industry, vendor and product type shared by products
+    in the order tests once per module. Each test still runs in its own
+    transaction, so only these read-only rows outlive a single test; they are
+    removed when the module finishes.
+    """
+    with django_db_blocker.unblock():
+        category = CategoryFactory.create()
+        industry = IndustryFactory.create()
+        vendor = VendorFactory.create()
+        product_type = ProductTypeFactory.create()
+
+    yield category, industry, vendor, product_type
+
+    with django_db_blocker.unblock():
+        product_type.delete()
+        vendor.delete()
+        industry.delete()
+        category.delete()
+
+
 @pytest.fixture
-def api_client():
+def two_products_for_user(create_user, create_product, catalog):
     """
-    Api client fixture.
+    Creates a user and two active products priced 10 and 20,
+    linked to the shared catalog rows.
+    Returns (user, product_1, product_2).
     """
-    return APIClient()
+    category, industry, vendor, product_type = catalog
+
+    user = create_user()
+
+    products = []
+    for price in (10, 20):
+        product = create_product.create(
+            category=category, vendor=vendor, is_active=True, price=price
+        )
+        product.industry.set([industry])
+        product.product_type.set([product_type])
+        products.append(product)
+
+    return user, *products
 
 
 class OrderFactory(factory.django.DjangoModelFactory):
@@ -54,3 +96,21 @@ def create_order_item():
     Fixture for OrderItemFactory.
     """
     return OrderItemFactory
+
+
+@pytest.fixture
+def create_order_items_bulk():
+    """
+    Creates the items of an order in a single INSERT.
+    Takes the order and (product, quantity) pairs, returns the created items.
+    """
+
+    def create(order: Order, specs) -> list[OrderItem]:
+        return OrderItem.objects.bulk_create(
+            [
+                OrderItem(order=order, product=product, quantity=quantity)
+                for product, quantity in specs
+            ]
+        )
+
+    return create
@@ -1,4 +1,5 @@
 import logging
+from typing import Callable
 
 import pytest
 from django.urls import reverse
@@ -11,203 +12,121 @@ from cart.models import Cart
 from cart.tests.conftest import create_cart, create_cart_item
 from delivery.models import CarrierChoices, Delivery
 from delivery.tests.conftest import create_address, create_area, create_city
-from store.tests.conftest import (create_category, create_industry,
-                                  create_product, create_product_type,
-                                  create_vendor)
+from store.tests.conftest import create_product
 from users.tests.conftest import create_user
 
 logger = logging.getLogger("project")
 
 
-# Testing GET Methods
-@pytest.mark.django_db
-def test_anonymous_user_cannot_access_cart(api_client: APIClient) -> None:
+@pytest.fixture(scope="module")
+def orders_list_url() -> str:
     """
-    Ensure that an unauthenticated user cannot get the order list.
-    The API should return 401 Unauthorized.
+    Resolve the orders list URL once per module.
     """
-
-    response = api_client.get(reverse("orders-list"), format="json")
-    assert response.status_code == HTTP_401_UNAUTHORIZED
+    return reverse("orders-list")
 
 
-@pytest.mark.django_db
-def test_authenticate_owner_can_get_orders_list(
-    api_client,
-    create_user,
-    create_product,
-    create_product_type,
-    create_vendor,
-    create_industry,
-    create_category,
-    create_order,
-    create_order_item,
-) -> None:
+@pytest.fixture(scope="module")
+def orders_detail_url(orders_list_url: str) -> Callable[[int], str]:
     """
-    Ensure that the user can get the orders list
+    Build order detail URLs from the list URL without walking the resolver.
     """
+    return lambda pk: f"{orders_list_url}{pk}/"
 
-    user = create_user()
-
-    # Create necessary related objects
-    category = create_category.create()
-    industry = create_industry.create()
-    vendor = create_vendor.create()
-    product_type = create_product_type.create()
-
-    # Create two active products
-    product_1 = create_product.create(
-        category=category, vendor=vendor, is_active=True, price=10
-    )
-    product_2 = create_product.create(
-        category=category, vendor=vendor, is_active=True, price=20
-    )
-
-    # Associate products with industry and product type
-    product_1.industry.set([industry])
-    product_1.product_type.set([product_type])
-    product_1.save()
-
-    product_2.industry.set([industry])
-    product_2.product_type.set([product_type])
-    product_2.save()
-
-    order_1 = create_order.create(user=user, status="pending")
-    order_2 = create_order.create(user=user, status="shipped")
 
-    order_item_1 = create_order_item.create(
-        order=order_1, product=product_1, quantity=2
-    )
-    order_item_2 = create_order_item.create(
-        order=order_1, product=product_2, quantity=3
-    )
-
-    order_item_1 = create_order_item.create(
-        order=order_2, product=product_1, quantity=2
-    )
-    order_item_2 = create_order_item.create(
-        order=order_2, product=product_2, quantity=3
-    )
-    api_client.force_authenticate(user=user)
-    response = api_client.get(reverse("orders-list"), format="json")
-
-    assert response.status_code == HTTP_200_OK
-    assert len(response.data) == 2
-
-    statuses: set[str] = {order["status"] for order in response.data}
-    assert statuses == {"pending", "shipped"}
-
-    required_fields: set[str] = {"id", "user", "status", "total_price", "items"}
-    for order in response.data:
-        assert required_fields.issubset(order.keys())
+# Testing GET Methods
+def test_anonymous_user_cannot_access_cart(
+    api_client: APIClient, orders_list_url
+) -> None:
+    """
+    Ensure that an unauthenticated user cannot get the order list.
+    The API should return 401 Unauthorized.
+    """
 
-    for order in response.data:
-        assert len(order["items"]) > 0
-        for item in order["items"]:
-            assert "product_name" in item
-            assert "quantity" in item
-            assert "total_price" in item
+    response = api_client.get(orders_list_url, format="json")
+    assert response.status_code == HTTP_401_UNAUTHORIZED
 
 
+@pytest.mark.parametrize("scenario", ["list_own", "list_other", "detail_own"])
 @pytest.mark.django_db
-def test_authenticate_user_cannot_access_another_users_orders(
+def test_authenticated_user_can_read_own_orders(
     api_client,
+    django_assert_num_queries,
+    django_assert_max_num_queries,
     create_user,
-    create_product,
-    create_product_type,
-    create_vendor,
-    create_industry,
-    create_category,
+    two_products_for_user,
     create_order,
     create_order_item,
+    create_order_items_bulk,
+    orders_list_url,
+    orders_detail_url,
+    scenario,
 ) -> None:
     """
-    Ensure that the user receives only their own orders list.
+    Ensure that a user can read their own orders and only their own orders.
+    - list_own: the owner gets the full orders list with items.
+    - list_other: another user receives only their own orders list.
+    - detail_own: the owner can retrieve the details of their order.
     """
 
-    user = create_user()
-    user_1 = create_user(email="user_1@example.com")
-
-    # Create necessary related objects
-    category = create_category.create()
-    industry = create_industry.create()
-    vendor = create_vendor.create()
-    product_type = create_product_type.create()
-
-    # Create active product
-    product_1 = create_product.create(
-        category=category, vendor=vendor, is_active=True, price=10
-    )
-
-    # Associate products with industry and product type
-    product_1.industry.set([industry])
-    product_1.product_type.set([product_type])
-    product_1.save()
+    user, product_1, product_2 = two_products_for_user
 
     order_1 = create_order.create(user=user, status="pending")
-    order_2 = create_order.create(user=user_1, status="shipping")
+    order_2 = create_order.create(user=user, status="shipped")
 
-    order_item_1 = create_order_item.create(
-        order=order_1, product=product_1, quantity=2
-    )
+    for order in (order_1, order_2):
+        create_order_items_bulk(order, [(product_1, 2), (product_2, 3)])
 
-    order_item_1 = create_order_item.create(
-        order=order_2, product=product_1, quantity=2
-    )
+    if scenario == "list_own":
+        api_client.force_authenticate(user=user)
 
-    api_client.force_authenticate(user=user_1)
+        # orders with their user, then items with their products
+        with django_assert_num_queries(2):
+            response = api_client.get(orders_list_url, format="json")
 
-    response = api_client.get(reverse("orders-list"), format="json")
-    assert response.status_code == HTTP_200_OK
-    assert len(response.data) == 1
-    assert response.data[0]["id"] == order_2.id
+        assert response.status_code == HTTP_200_OK
+        assert len(response.data) == 2
 
+        statuses: set[str] = {order["status"] for order in response.data}
+        assert statuses == {"pending", "shipped"}
 
-@pytest.mark.django_db
-def test_user_can_get_own_order_detail(
-    api_client,
-    create_user,
-    create_order,
-    create_order_item,
-    create_category,
-    create_product,
-    create_industry,
-    create_product_type,
-    create_vendor,
-):
-    """
-    Test that an authenticated user can retrieve the details of their own order.
-    """
+        required_fields: set[str] = {"id", "user", "status", "total_price", "items"}
+        for order in response.data:
+            assert required_fields.issubset(order.keys())
 
-    user = create_user()
+        for order in response.data:
+            assert len(order["items"]) > 0
+            for item in order["items"]:
+                assert "product_name" in item
+                assert "quantity" in item
+                assert "total_price" in item
 
-    category = create_category.create()
-    industry = create_industry.create()
-    vendor = create_vendor.create()
-    product_type = create_product_type.create()
+    elif scenario == "list_other":
+        user_1 = create_user(email="user_1@example.com")
+        order_3 = create_order.create(user=user_1, status="shipping")
+        create_order_item.create(order=order_3, product=product_1, quantity=2)
 
-    product = create_product.create(
-        category=category, vendor=vendor, is_active=True, price=10
-    )
+        api_client.force_authenticate(user=user_1)
 
-    product.industry.set([industry])
-    product.product_type.set([product_type])
-    product.save()
+        response = api_client.get(orders_list_url, format="json")
+        assert response.status_code == HTTP_200_OK
+        assert len(response.data) == 1
+        assert response.data[0]["id"] == order_3.id
 
-    order = create_order.create(user=user)
-    create_order_item.create(order=order, product=product, quantity=10)
+    elif scenario == "detail_own":
+        api_client.force_authenticate(user)
 
-    api_client.force_authenticate(user)
+        with django_assert_max_num_queries(3):
+            response = api_client.get(orders_detail_url(order_1.id))
 
-    response = api_client.get(reverse("orders-detail", kwargs={"pk": order.id}))
-    assert response.status_code == HTTP_200_OK
-    assert response.data["id"] == order.id
-    assert response.data["user"] == user.email
+        assert response.status_code == HTTP_200_OK
+        assert response.data["id"] == order_1.id
+        assert response.data["user"] == user.email
 
 
 @pytest.mark.django_db
 def test_user_cannot_get_other_users_order_detail(
-    api_client, create_user, create_order
+    api_client, create_user, create_order, orders_detail_url
 ):
     """
     Test that a user cannot retrieve the details of another user's order.
@@ -220,7 +139,7 @@ def test_user_cannot_get_other_users_order_detail(
 
     api_client.force_authenticate(user)
 
-    response = api_client.get(reverse("orders-detail", kwargs={"pk": order.id}))
+    response = api_client.get(orders_detail_url(order.id))
     assert response.status_code == HTTP_404_NOT_FOUND
 
 
@@ -228,48 +147,20 @@ def test_user_cannot_get_other_users_order_detail(
 @pytest.mark.django_db
 def test_authenticate_user_can_create_orders(
     api_client: APIClient,
-    create_user,
-    create_product,
-    create_product_type,
-    create_vendor,
-    create_industry,
-    create_category,
+    two_products_for_user,
     create_cart,
     create_cart_item,
     create_order,
     create_area,
     create_city,
     create_address,
+    orders_list_url,
 ) -> None:
     """
     Ensure that an authenticated user can create order and delivery.
     The API should return the order lists.
     """
-    # logger.info(f"Starting logging")
-    user = create_user()
-
-    # Create necessary related objects
-    category = create_category.create()
-    industry = create_industry.create()
-    vendor = create_vendor.create()
-    product_type = create_product_type.create()
-
-    # Create two active products
-    product_1 = create_product.create(
-        category=category, vendor=vendor, is_active=True, price=10
-    )
-    product_2 = create_product.create(
-        category=category, vendor=vendor, is_active=True, price=20
-    )
-
-    # Associate products with industry and product type
-    product_1.industry.set([industry])
-    product_1.product_type.set([product_type])
-    product_1.save()
-
-    product_2.industry.set([industry])
-    product_2.product_type.set([product_type])
-    product_2.save()
+    user, product_1, product_2 = two_products_for_user
 
     # Create cart
     cart_active = Cart.objects.create(user=user, status="active")
@@ -291,7 +182,7 @@ def test_authenticate_user_can_create_orders(
     data = {"delivery_address_id": address.id}
 
     api_client.force_authenticate(user=user)
-    response = api_client.post(reverse("orders-list"), data, format="json")
+    response = api_client.post(orders_list_url, data, format="json")
 
     assert response.status_code == HTTP_201_CREATED
     assert response.data["user"] == user.email
@@ -317,20 +208,24 @@ def test_authenticate_user_can_create_orders(
     assert delivery.delivery_address_id == address.id
 
 
-@pytest.mark.django_db
-def test_anonymous_cannot_create_orders(api_client: APIClient):
+def test_anonymous_cannot_create_orders(api_client: APIClient, orders_list_url):
     """
     Ensure that an anonymous user cannot create an order.
     The API should return 401 Unauthorized.
     """
 
-    response = api_client.post(reverse("orders-list"))
+    response = api_client.post(orders_list_url)
     assert response.status_code == HTTP_401_UNAUTHORIZED
 
 
 @pytest.mark.django_db
 def test_authenticated_user_cannot_create_order_without_cart(
-    api_client: APIClient, create_user, create_area, create_city, create_address
+    api_client: APIClient,
+    create_user,
+    create_area,
+    create_city,
+    create_address,
+    orders_list_url,
 ):
     """
     Ensure that an authenticated user cannot create an order without an active cart.
@@ -344,7 +239,7 @@ def test_authenticated_user_cannot_create_order_without_cart(
 
     api_client.force_authenticate(user=user)
     response = api_client.post(
-        reverse("orders-list"), {"delivery_address_id": address.id}, format="json"
+        orders_list_url, {"delivery_address_id": address.id}, format="json"
     )
 
     assert response.status_code == HTTP_400_BAD_REQUEST
@@ -353,7 +248,13 @@ def test_authenticated_user_cannot_create_order_without_cart(
 
 @pytest.mark.django_db
 def test_authenticated_user_cannot_create_order_with_empty_cart(
-    api_client, create_user, create_cart, create_area, create_city, create_address
+    api_client,
+    create_user,
+    create_cart,
+    create_area,
+    create_city,
+    create_address,
+    orders_list_url,
 ):
     """
     Ensure that an authenticated user cannot create an order with an empty cart.
@@ -368,7 +269,7 @@ def test_authenticated_user_cannot_create_order_with_empty_cart(
 
     api_client.force_authenticate(user=user)
     response = api_client.post(
-        reverse("orders-list"), {"delivery_address_id": address.id}, format="json"
+        orders_list_url, {"delivery_address_id": address.id}, format="json"
     )
 
     assert response.status_code == HTTP_400_BAD_REQUEST
@@ -378,7 +279,7 @@ def test_authenticated_user_cannot_create_order_with_empty_cart(
 # Testing PATCH Methods
 @pytest.mark.django_db
 def test_authenticated_user_can_cancel_pending_and_paid_order(
-    api_client, create_user, create_order, create_order_item
+    api_client, create_user, create_order, create_order_item, orders_detail_url
 ) -> None:
     """
     Test that an authenticated user can cancel orders with 'pending' or 'paid' status.
@@ -394,7 +295,7 @@ def test_authenticated_user_can_cancel_pending_and_paid_order(
     data = {"status": "canceled"}
 
     response = api_client.patch(
-        reverse("orders-detail", kwargs={"pk": order_pending.id}),
+        orders_detail_url(order_pending.id),
         data=data,
         format="json",
     )
@@ -402,7 +303,7 @@ def test_authenticated_user_can_cancel_pending_and_paid_order(
     assert response.data["status"] == "canceled"
 
     response = api_client.patch(
-        reverse("orders-detail", kwargs={"pk": order_paid.id}), data=data, format="json"
+        orders_detail_url(order_paid.id), data=data, format="json"
     )
     assert response.status_code == HTTP_200_OK
     assert response.data["status"] == "canceled"
@@ -411,7 +312,7 @@ def test_authenticated_user_can_cancel_pending_and_paid_order(
 @pytest.mark.parametrize("status", ["shipped", "delivered", "canceled", "returned"])
 @pytest.mark.django_db
 def test_user_cannot_cancel_order_in_invalid_status(
-    api_client, create_user, create_order, status
+    api_client, create_user, create_order, status, orders_detail_url
 ):
     """
     Ensure that a user cannot cancel an order if its status is invalid for cancellation.
@@ -423,7 +324,7 @@ def test_user_cannot_cancel_order_in_invalid_status(
     api_client.force_authenticate(user)
 
     response = api_client.patch(
-        reverse("orders-detail", kwargs={"pk": order.id}),
+        orders_detail_url(order.id),
         data={"status": "canceled"},
         format="json",
     )
@@ -433,7 +334,9 @@ def test_user_cannot_cancel_order_in_invalid_status(
 
 
 @pytest.mark.django_db
-def test_user_cannot_cancel_other_users_order(api_client, create_user, create_order):
+def test_user_cannot_cancel_other_users_order(
+    api_client, create_user, create_order, orders_detail_url
+):
     """Ensure that a user cannot cancel an order that belong to another user"""
 
     owner = create_user()
@@ -443,7 +346,7 @@ def test_user_cannot_cancel_other_users_order(api_client, create_user, create_or
     api_client.force_authenticate(user=user)
 
     response = api_client.patch(
-        reverse("orders-detail", kwargs={"pk": order.id}),
+        orders_detail_url(order.id),
         data={"status": "canceled"},
         format="json",
     )
@@ -452,7 +355,9 @@ def test_user_cannot_cancel_other_users_order(api_client, create_user, create_or
 
 
 @pytest.mark.django_db
-def test_anonymous_user_cannot_cancel_order(api_client, create_order, create_user):
+def test_anonymous_user_cannot_cancel_order(
+    api_client, create_order, create_user, orders_detail_url
+):
     """
     Ensure that an anonymous user cannot cancel an order
     """
@@ -461,7 +366,7 @@ def test_anonymous_user_cannot_cancel_order(api_client, create_order, create_use
     order = create_order.create(user=user, status="pending")
 
     response = api_client.patch(
-        reverse("orders-detail", kwargs={"pk": order.id}),
+        orders_detail_url(order.id),
         data={"status": "canceled"},
         format="json",
     )
@@ -471,7 +376,7 @@ def test_anonymous_user_cannot_cancel_order(api_client, create_order, create_use
 
 @pytest.mark.django_db
 def test_user_cannot_update_order_with_invalid_status(
-    api_client, create_user, create_order
+    api_client, create_user, create_order, orders_detail_url
 ):
     """
     Ensure that the user cannot update order with invalid status
@@ -483,7 +388,7 @@ def test_user_cannot_update_order_with_invalid_status(
     api_client.force_authenticate(user=user)
 
     response = api_client.patch(
-        reverse("orders-detail", kwargs={"pk": order.id}),
+        orders_detail_url(order.id),
         data={"status": "invalid_status"},
         format="json",
     )
@@ -493,7 +398,9 @@ def test_user_cannot_update_order_with_invalid_status(
 
 
 @pytest.mark.django_db
-def test_user_cannot_patch_order_with_empty_data(api_client, create_user, create_order):
+def test_user_cannot_patch_order_with_empty_data(
+    api_client, create_user, create_order, orders_detail_url
+):
     """
     Ensure that the user cannot update order with empty data
     """
@@ -503,8 +410,6 @@ def test_user_cannot_patch_order_with_empty_data(api_client, create_user, create
 
     api_client.force_authenticate(user)
 
-    response = api_client.patch(
-        reverse("orders-detail", kwargs={"pk": order.id}), data={}, format="json"
-    )
+    response = api_client.patch(orders_detail_url(order.id), data={}, format="json")
 
     assert response.status_code == HTTP_400_BAD_REQUEST
@@ -1,5 +1,6 @@
 import logging
 
+from django.db.models import Prefetch
 from rest_framework import mixins, status, viewsets
 from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
@@ -7,7 +8,7 @@ from rest_framework.response import Response
 
 from orders.services import OrderService
 
-from .models import Order
+from .models import Order, OrderItem
 from .serializers import OrderSerializer
 
 logger = logging.getLogger("project")
@@ -34,9 +35,16 @@ class OrderViewSet(
 
     def get_queryset(self):
         """
-        Returns a queryset of orders belonging to the currently authenticated user.
+        Returns a queryset of orders belonging to the currently authenticated user,
+        with the user, items and their products loaded up front.
         """
-        return Order.objects.filter(user=self.request.user)
+        return (
+            Order.objects.filter(user=self.request.user)
+            .select_related("user")
+            .prefetch_related(
+                Prefetch("items", queryset=OrderItem.objects.select_related("product"))
+            )
+        )
 
     def create(self, request, *args, **kwargs) -> Response:
         """
@@ -71,14 +79,15 @@ class OrderViewSet(
         """
         order = self.get_object()
 
-        serializer = OrderSerializer(order, data=request.data, partial=True)
+        serializer = self.get_serializer(order, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
 
         try:
-            canceled_order = OrderService.cancel_order(order)
+            OrderService.cancel_order(order)
 
         except ValidationError as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-        serializer = self.get_serializer(canceled_order)
+        # cancel_order updates the prefetched instance in place, so the same
+        # serializer renders the result without reloading items and products.
         return Response(serializer.data, status=status.HTTP_200_OK)
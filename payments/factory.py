@@ -1,5 +1,4 @@
-from typing import Any
-
+from payments.gateways.base import PaymentGateway
 from payments.gateways.fondy import FondyPayGateway
 from payments.gateways.liqpay import LiqpayPayGateway
 from payments.gateways.monobank import MonobankPayGateway
@@ -7,18 +6,29 @@ from payments.gateways.monobank import MonobankPayGateway
 
 class PaymentFactory:
     """
-    Factory class for instantiating payment gateway handlers.
+    Factory class for resolving payment gateway handlers.
+
+    Gateways are stateless, so a single instance of each is created at import
+    time and shared between requests.
     """
 
-    gateways = {
-        "liqpay": LiqpayPayGateway,
-        "fondy": FondyPayGateway,
-        "monobank": MonobankPayGateway,
+    gateways: dict[str, PaymentGateway] = {
+        "liqpay": LiqpayPayGateway(),
+        "monobank": MonobankPayGateway(),
+        "fondy": FondyPayGateway(),
     }
 
-    @staticmethod
-    def get_gateway(gateway_name: str) -> Any:
+    SUPPORTED: tuple[str, ...] = tuple(gateways)
+
+    @classmethod
+    def get_gateway(cls, gateway_name: str) -> PaymentGateway:
         """
-        Returns an instance of the payment gateway class based on the provided name.
+        Returns the payment gateway instance for the provided name.
+
+        Names are validated against SUPPORTED by the payment serializers, so an
+        unknown name here is a programming error rather than a client error.
         """
-        return PaymentFactory.gateways[gateway_name.lower()]()
+        gateway = cls.gateways.get(gateway_name.lower())
+        if gateway is None:
+            raise ValueError(f"Unknown payment gateway: {gateway_name}")
+        return gateway
@@ -60,13 +60,14 @@ class LiqpayPayGateway(PaymentGateway):
             "status": status,
         }
 
-        json_data = json.dumps(data_payload)
+        json_data = json.dumps(data_payload, separators=(",", ":"))
         data_base64 = base64.b64encode(json_data.encode()).decode()
 
         signature = self._generate_signature(data_base64)
 
         return {
             "data": data_base64,
+            "parsed": data_payload,
             "signature": signature,
             "gateway": "liqpay",
             "payment_token": payment_token,
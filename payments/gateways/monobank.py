@@ -2,13 +2,14 @@ import base64
 import hashlib
 import json
 import random
-import uuid
+import secrets
 from decimal import Decimal
 from typing import Any
 
-from django.conf import settings
-
 from payments.gateways.base import PaymentGateway
+from payments.utils import MONOBANK_MAC_KEY
+
+_OUTCOMES: tuple[str, str] = ("success", "failure")
 
 
 class MonobankPayGateway(PaymentGateway):
@@ -17,13 +18,12 @@ class MonobankPayGateway(PaymentGateway):
     """
 
     @staticmethod
-    def _generate_signature(data: dict | str) -> str:
+    def _generate_signature(data: bytes) -> str:
         """
-        Emulation signature for bank
+        Emulation signature for bank, a keyed BLAKE2b MAC of the data
         """
 
-        secret_key = settings.MONOBANK_SECRET_KEY
-        return hashlib.sha1(f"{secret_key}{data}{secret_key}".encode()).hexdigest()
+        return hashlib.blake2b(data, key=MONOBANK_MAC_KEY, digest_size=20).hexdigest()
 
     def create_payment(
         self, order_id: int, amount: Decimal, currency: str = "UAH"
@@ -32,7 +32,7 @@ class MonobankPayGateway(PaymentGateway):
         Emulating payment creation
         """
 
-        payment_token = f"MB-{uuid.uuid4()}"
+        payment_token = "MB-" + secrets.token_urlsafe(16)
 
         data = {
             "order_id": order_id,
@@ -43,7 +43,11 @@ class MonobankPayGateway(PaymentGateway):
             "status": "pending",
         }
 
-        data["signature"] = self._generate_signature(data)
+        data["signature"] = self._generate_signature(
+            json.dumps(
+                data, sort_keys=True, separators=(",", ":"), default=str
+            ).encode()
+        )
 
         return data
 
@@ -51,7 +55,7 @@ class MonobankPayGateway(PaymentGateway):
         """
         Emulating payment checks
         """
-        status = random.choice(["success", "failure"])
+        status = _OUTCOMES[random.getrandbits(1)]
 
         data_payload = {
             "payment_token": payment_token,
@@ -59,13 +63,14 @@ class MonobankPayGateway(PaymentGateway):
             "status": status,
         }
 
-        json_data = json.dumps(data_payload)
+        json_data = json.dumps(data_payload, separators=(",", ":"))
         data_base64 = base64.b64encode(json_data.encode()).decode()
 
-        signature = self._generate_signature(data_base64)
+        signature = self._generate_signature(data_base64.encode())
 
         return {
             "data": data_base64,
+            "parsed": data_payload,
             "signature": signature,
             "gateway": "monobank",
             "payment_token": payment_token,
@@ -15,4 +15,4 @@ class IsOrderOwner(BasePermission):
         return request.user and request.user.is_authenticated
 
     def has_object_permission(self, request: Request, view: APIView, obj: Any) -> bool:
-        return obj.user == request.user
+        return obj.user_id == request.user.id
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from .factory import PaymentFactory
+
 
 class PaymentProcessingSerializer(serializers.Serializer):
     """
@@ -10,7 +12,7 @@ class PaymentProcessingSerializer(serializers.Serializer):
     """
 
     gateway = serializers.ChoiceField(
-        choices=["liqpay", "monobank", "fondy"],
+        choices=PaymentFactory.SUPPORTED,
         error_messages={"invalid_choice": "Gateway not supported"},
     )
 
@@ -24,7 +26,7 @@ class CallbackSerializer(serializers.Serializer):
     """
 
     gateway = serializers.ChoiceField(
-        choices=["liqpay", "monobank", "fondy"],
+        choices=PaymentFactory.SUPPORTED,
         error_messages={"invalid_choice": "Gateway not supported"},
     )
     data = serializers.CharField()
@@ -6,6 +6,8 @@ from typing import Any
 
 from django.db import transaction
 
+from orders.models import Order
+
 from .exceptions import PaymentGatewayException, PaymentProcessingException
 from .factory import PaymentFactory
 from .models import Payment
@@ -15,9 +17,9 @@ logger = logging.getLogger("project")
 
 class PaymentService:
 
-    @staticmethod
+    @classmethod
     def process_payment(
-        order_id: int, amount: Decimal, gateway_name: str = "liqpay"
+        cls, order_id: int, amount: Decimal, gateway_name: str = "liqpay"
     ) -> dict[str, Any]:
         """
         Handles payment processing for a given order.
@@ -43,18 +45,33 @@ class PaymentService:
 
         return payment_data
 
-    @staticmethod
-    @transaction.atomic
+    @classmethod
     def check_payment(
-        payment_token: str, gateway_name: str = "liqpay"
+        cls, payment_token: str, gateway_name: str = "liqpay"
     ) -> dict[str, Any]:
         """
         Verifies and updates the payment status using the provided payment token.
 
-        Contacts the payment gateway to retrieve the current status, updates the Payment
-        and associated Order records atomically, and ensures that already-processed
-        payments are not reprocessed.
+        Already-processed payments are answered from a plain read, without a row
+        lock or a gateway call. Otherwise contacts the payment gateway to retrieve
+        the current status and updates the Payment and associated Order records
+        atomically, re-checking the status under the lock. A callback that finds
+        the payment locked by another one is answered as still processing, so
+        the gateway retries it if that callback rolls back.
         """
+        current_status = (
+            Payment.objects.filter(payment_token=payment_token)
+            .values_list("status", flat=True)
+            .first()
+        )
+
+        if current_status is None:
+            raise PaymentProcessingException("Payment not found")
+
+        if current_status != "pending":
+            logger.info(f"Payment {payment_token}, already processed")
+            return {"status": current_status, "message": "already processed"}
+
         gateway = PaymentFactory.get_gateway(gateway_name)
         try:
             payment_data = gateway.check_payment_status(payment_token)
@@ -62,28 +79,35 @@ class PaymentService:
             logger.error(f"Payment gateway error:  {e}")
             raise PaymentGatewayException from e
 
-        try:
+        with transaction.atomic():
             payment = (
-                Payment.objects.select_for_update()
-                .select_related("order")
-                .get(payment_token=payment_token)
+                Payment.objects.select_for_update(of=("self",), skip_locked=True)
+                .filter(payment_token=payment_token)
+                .first()
             )
-        except Payment.DoesNotExist:
-            raise PaymentProcessingException("Payment not found")
-
-        if payment.status != "pending":
-            logger.info(f"Payment {payment_token}, already processed")
-            return {"status": payment.status, "message": "already processed"}
-
-        decode = base64.b64decode(payment_data["data"]).decode()
-        payload = json.loads(decode)
-        payment.status = payload["status"]
-        payment.save()
-
-        order = payment.order
-        order.status = "paid" if payment.status == "success" else "failed"
-        order.save()
 
-        logger.info(f"Payment status updated: {payload['status']} - {payment.order}")
+            # The payment exists, so a missing row means a concurrent callback
+            # holds the lock and is settling it; don't queue behind it.
+            if payment is None:
+                logger.info(f"Payment {payment_token}, already being processed")
+                return {"status": "pending", "message": "processing"}
+
+            if payment.status != "pending":
+                logger.info(f"Payment {payment_token}, already processed")
+                return {"status": payment.status, "message": "already processed"}
+
+            # In-process gateways hand back the payload they encoded; only fall
+            # back to decoding the wire format when it is absent.
+            payload = payment_data.get("parsed")
+            if payload is None:
+                payload = json.loads(base64.b64decode(payment_data["data"]))
+            payment.status = payload["status"]
+            payment.save(update_fields=["status", "time_updated"])
+
+            order = Order.objects.select_for_update().get(pk=payment.order_id)
+            order.status = "paid" if payment.status == "success" else "failed"
+            order.save(update_fields=["status", "time_updated"])
+
+        logger.info(f"Payment status updated: {payload['status']} - {order}")
 
         return {"status": payload["status"]}
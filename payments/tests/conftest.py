@@ -1,60 +1,93 @@
+import base64
+import json
+from typing import Callable
+
 import pytest
-from rest_framework.test import APIClient
 
-from orders.tests.conftest import create_order, create_order_item
-from store.tests.conftest import (create_category, create_industry,
-                                  create_product, create_product_type,
-                                  create_vendor)
+from orders.models import Order
+from orders.tests.conftest import (create_order, create_order_item,
+                                   create_order_items_bulk)
+from payments.gateways.liqpay import LiqpayPayGateway
+from store.tests.conftest import (CategoryFactory, IndustryFactory,
+                                  ProductFactory, ProductTypeFactory,
+                                  VendorFactory)
+from users.tests.conftest import create_user
 
 
-@pytest.fixture
-def api_client():
+@pytest.fixture(scope="module")
+def liqpay_gateway():
+    """
+    LiqPay gateway shared by the tests in a module; gateways are stateless.
+    """
+    return LiqpayPayGateway()
+
+
+@pytest.fixture(scope="module")
+def signed_fake_callback(liqpay_gateway) -> Callable[[dict], tuple[str, str]]:
     """
-    Api client fixture.
+    Returns a builder of LiqPay-signed callback data for a payload.
+    Each distinct payload is encoded and signed once per module.
+    Returns (encoded_data, signature).
     """
-    return APIClient()
+    signed: dict[str, tuple[str, str]] = {}
+
+    def build(payload: dict) -> tuple[str, str]:
+        json_payload = json.dumps(payload)
+        if json_payload not in signed:
+            encoded_data = base64.b64encode(json_payload.encode()).decode()
+            signed[json_payload] = (
+                encoded_data,
+                liqpay_gateway._generate_signature(encoded_data),
+            )
+        return signed[json_payload]
+
+    return build
+
+
+@pytest.fixture(scope="module")
+def create_filled_products(django_db_setup, django_db_blocker):
+    """
+    Creates two active products priced 15 and 20, with their catalog rows,
+    once per module. Each test still runs in its own transaction, so only
+    these read-only rows outlive a single test; they are removed when the
+    module finishes.
+    """
+    with django_db_blocker.unblock():
+        category = CategoryFactory.create()
+        industry = IndustryFactory.create()
+        vendor = VendorFactory.create()
+        product_type = ProductTypeFactory.create()
+
+        products = []
+        for price in (15, 20):
+            product = ProductFactory.create(
+                category=category, vendor=vendor, is_active=True, price=price
+            )
+            product.industry.set([industry])
+            product.product_type.set([product_type])
+            products.append(product)
+
+    yield tuple(products)
+
+    with django_db_blocker.unblock():
+        for product in products:
+            product.delete()
+        product_type.delete()
+        vendor.delete()
+        industry.delete()
+        category.delete()
 
 
 @pytest.fixture
-def create_filled_products(
-    create_vendor, create_industry, create_product_type, create_category, create_product
-):
-    category = create_category.create()
-    industry = create_industry.create()
-    vendor = create_vendor.create()
-    product_type = create_product_type.create()
-
-    product = create_product.create(
-        category=category, vendor=vendor, is_active=True, price=15
-    )
-
-    product.industry.set(
-        [
-            industry,
-        ]
-    )
-    product.product_type.set(
-        [
-            product_type,
-        ]
-    )
-
-    product2 = create_product.create(
-        category=category, vendor=vendor, is_active=True, price=20
-    )
-
-    product2.industry.set(
-        [
-            industry,
-        ]
-    )
-    product2.product_type.set(
-        [
-            product_type,
-        ]
-    )
-
-    product.save()
-    product2.save()
-
-    return product, product2
+def filled_order(
+    create_user, create_filled_products, create_order, create_order_item
+) -> Order:
+    """
+    Creates a pending order with one item for a new user.
+    """
+    product, _ = create_filled_products
+
+    order = create_order.create(user=create_user())
+    create_order_item(order=order, product=product, quantity=2)
+
+    return order
@@ -1,5 +1,3 @@
-import base64
-import json
 from decimal import Decimal
 from typing import Any, Callable, Tuple
 
@@ -8,18 +6,35 @@ from django.urls import reverse
 from rest_framework.status import (HTTP_200_OK, HTTP_201_CREATED,
                                    HTTP_202_ACCEPTED, HTTP_400_BAD_REQUEST,
                                    HTTP_401_UNAUTHORIZED, HTTP_403_FORBIDDEN,
-                                   HTTP_404_NOT_FOUND)
+                                   HTTP_404_NOT_FOUND, HTTP_409_CONFLICT)
 from rest_framework.test import APIClient
 
-from orders.models import OrderItem
+from orders.models import Order, OrderItem
 from orders.tests.conftest import create_order
 from payments.gateways.liqpay import LiqpayPayGateway
+from payments.gateways.monobank import MonobankPayGateway
 from store.models import Product
 from users.models import AuthUser
 from users.tests.conftest import create_user
 
 from ..models import Payment
-from .conftest import api_client
+
+
+@pytest.fixture(scope="module")
+def callback_url() -> str:
+    """
+    Resolve the payment callback URL once per module.
+    """
+    return reverse("payment-callback")
+
+
+@pytest.fixture(scope="module")
+def process_url() -> Callable[[int], str]:
+    """
+    Resolve the payment process route once and build per-order URLs from it.
+    """
+    prefix, suffix = reverse("payment-process", kwargs={"pk": 0}).rsplit("/0/", 1)
+    return lambda pk: f"{prefix}/{pk}/{suffix}"
 
 
 @pytest.mark.django_db
@@ -27,8 +42,9 @@ def test_authenticated_user_can_create_payment(
     api_client: APIClient,
     create_user: Callable[..., AuthUser],
     create_filled_products: Tuple[Product, Product],
-    create_order_item: Callable[..., OrderItem],
+    create_order_items_bulk: Callable[..., list[OrderItem]],
     create_order: Any,
+    process_url: Callable[[int], str],
 ) -> None:
     """
     Ensure that an authorized user can make a payment.
@@ -40,16 +56,13 @@ def test_authenticated_user_can_create_payment(
 
     order = create_order.create(user=user)
 
-    order_item_1 = create_order_item(order=order, product=product_1, quantity=2)
-    order_item_2 = create_order_item(order=order, product=product_2, quantity=1)
+    create_order_items_bulk(order, [(product_1, 2), (product_2, 1)])
 
     api_client.force_authenticate(user)
 
     data = {"gateway": "liqpay"}
 
-    response = api_client.post(
-        reverse("payment-process", kwargs={"pk": order.id}), data, format="json"
-    )
+    response = api_client.post(process_url(order.id), data, format="json")
 
     assert response.status_code == HTTP_201_CREATED
 
@@ -68,69 +81,48 @@ def test_authenticated_user_can_create_payment(
 # ----------------------------------------------------------------
 # Testing payments processing
 # ----------------------------------------------------------------
+@pytest.mark.parametrize(
+    "auth, gateway, expected_status",
+    [
+        (None, "liqpay", HTTP_401_UNAUTHORIZED),
+        ("other", "liqpay", HTTP_403_FORBIDDEN),
+        ("owner", "Non exists gateway", HTTP_400_BAD_REQUEST),
+    ],
+    ids=["anonymous", "not_order_owner", "non_existing_gateway"],
+)
 @pytest.mark.django_db
-def test_anonymous_can_not_create_payment(
+def test_create_payment_failures(
     api_client: APIClient,
     create_user: Callable[..., AuthUser],
-    create_filled_products: Tuple[Product, Product],
-    create_order_item: Callable[..., OrderItem],
-    create_order: Any,
+    filled_order: Order,
+    auth: str | None,
+    gateway: str,
+    expected_status: int,
+    process_url: Callable[[int], str],
 ) -> None:
     """
-    Ensure that the anonymous user can not make payment
+    Ensure that payment creation is rejected:
+    - anonymous users receive 401 Unauthorized;
+    - a user who does not own the order receives 403 Forbidden;
+    - a non-existing gateway results in 400 Bad Request.
     """
 
-    user = create_user()
-
-    product_1, _ = create_filled_products
-
-    order = create_order.create(user=user)
-    order_item_1 = create_order_item(order=order, product=product_1, quantity=2)
+    if auth == "owner":
+        api_client.force_authenticate(filled_order.user)
+    elif auth == "other":
+        api_client.force_authenticate(create_user(email="other@example.com"))
 
-    data = {"gateway": "liqpay"}
-    response = api_client.post(
-        reverse("payment-process", kwargs={"pk": order.id}), data, format="json"
-    )
+    data = {"gateway": gateway}
+    response = api_client.post(process_url(filled_order.id), data, format="json")
 
-    assert response.status_code == HTTP_401_UNAUTHORIZED
+    assert response.status_code == expected_status
 
 
 @pytest.mark.django_db
-def test_only_order_owner_can_make_payment(
+def test_create_payment_for_non_existing_order(
     api_client: APIClient,
     create_user: Callable[..., AuthUser],
-    create_filled_products: Tuple[Product, Product],
-    create_order_item: Callable[..., OrderItem],
-    create_order: Any,
-) -> None:
-    """
-    Test that only the order owner can initiate payment.
-
-    Ensure a user who does not own the order receives HTTP 403 Forbidden
-    when attempting to make a payment.
-    """
-
-    user = create_user()
-    owner = create_user(email="owner@example.com")
-
-    product_1, _ = create_filled_products
-
-    order = create_order.create(user=owner)
-    order_item_1 = create_order_item(order=order, product=product_1, quantity=2)
-
-    api_client.force_authenticate(user)
-
-    data = {"gateway": "liqpay"}
-    response = api_client.post(
-        reverse("payment-process", kwargs={"pk": order.id}), data, format="json"
-    )
-
-    assert response.status_code == HTTP_403_FORBIDDEN
-
-
-@pytest.mark.django_db
-def test_create_payment_for_non_existing_order(
-    api_client: APIClient, create_user: Callable[..., AuthUser]
+    process_url: Callable[[int], str],
 ) -> None:
     """
     Test payment creation for a non-existing order.
@@ -141,42 +133,11 @@ def test_create_payment_for_non_existing_order(
     api_client.force_authenticate(user)
 
     data = {"gateway": "liqpay"}
-    response = api_client.post(
-        reverse("payment-process", kwargs={"pk": 20}), data, format="json"
-    )
+    response = api_client.post(process_url(20), data, format="json")
 
     assert response.status_code == HTTP_404_NOT_FOUND
 
 
-@pytest.mark.django_db
-def test_create_payment_with_non_existing_gateway(
-    api_client: APIClient,
-    create_user: Callable[..., AuthUser],
-    create_filled_products: Tuple[Product, Product],
-    create_order_item: Callable[..., OrderItem],
-    create_order: Any,
-) -> None:
-    """
-    Test that payment creation fails and api status 400 when using a non-existing gateway.
-    """
-
-    user = create_user()
-
-    product_1, _ = create_filled_products
-
-    order = create_order.create(user=user)
-    order_item_1 = create_order_item(order=order, product=product_1, quantity=2)
-
-    api_client.force_authenticate(user)
-
-    data = {"gateway": "Non exists gateway"}
-    response = api_client.post(
-        reverse("payment-process", kwargs={"pk": order.id}), data, format="json"
-    )
-
-    assert response.status_code == HTTP_400_BAD_REQUEST
-
-
 # ----------------------------------------------------------------
 # Testing payments callback
 # ----------------------------------------------------------------
@@ -185,8 +146,11 @@ def test_callback_with_correct_signature(
     api_client: APIClient,
     create_user: Callable[..., AuthUser],
     create_filled_products: Tuple[Product, Product],
-    create_order_item: Callable[..., OrderItem],
+    create_order_items_bulk: Callable[..., list[OrderItem]],
     create_order: Any,
+    liqpay_gateway: LiqpayPayGateway,
+    process_url: Callable[[int], str],
+    callback_url: str,
 ) -> None:
     """
     Test that an authenticated user can correctly receive and process a payment callback.
@@ -204,19 +168,16 @@ def test_callback_with_correct_signature(
 
     order = create_order.create(user=user)
 
-    order_item_1 = create_order_item(order=order, product=product_1, quantity=2)
-    order_item_2 = create_order_item(order=order, product=product_2, quantity=1)
+    create_order_items_bulk(order, [(product_1, 2), (product_2, 1)])
 
     api_client.force_authenticate(user)
     data_payment = {"gateway": "liqpay"}
     created_payment = api_client.post(
-        reverse("payment-process", kwargs={"pk": order.id}), data_payment, format="json"
+        process_url(order.id), data_payment, format="json"
     )
 
-    gateway = LiqpayPayGateway()
-
     payment_token = created_payment.data["payment_token"]
-    payment_status = gateway.check_payment_status(payment_token)
+    payment_status = liqpay_gateway.check_payment_status(payment_token)
 
     data_from_bank = {
         "gateway": payment_status["gateway"],
@@ -225,9 +186,7 @@ def test_callback_with_correct_signature(
         "data": payment_status["data"],
     }
 
-    response = api_client.post(
-        reverse("payment-callback"), data=data_from_bank, format="json"
-    )
+    response = api_client.post(callback_url, data=data_from_bank, format="json")
 
     assert response.status_code == HTTP_202_ACCEPTED
     assert response.data["status"] in ["success", "failure"]
@@ -241,32 +200,35 @@ def test_callback_with_correct_signature(
 
 
 @pytest.mark.django_db
-def test_callback_with_invalid_signature(
+def test_callback_with_correct_monobank_signature(
     api_client: APIClient,
-    create_user,
-    create_order,
-    create_order_item,
-    create_filled_products,
+    create_user: Callable[..., AuthUser],
+    create_filled_products: Tuple[Product, Product],
+    create_order_item: Callable[..., OrderItem],
+    create_order: Any,
+    process_url: Callable[[int], str],
+    callback_url: str,
 ) -> None:
     """
-    Test that the payment callback endpoint returns 403 Forbidden
-    when the provided signature is invalid.
+    Test that a callback signed by Monobank with its keyed BLAKE2b MAC
+    passes signature verification and is processed.
     """
+
     user = create_user()
-    order = create_order.create(user=user)
 
     product_1, _ = create_filled_products
-    create_order_item(order=order, product=product_1, quantity=1)
 
-    api_client.force_authenticate(user=user)
+    order = create_order.create(user=user)
+    create_order_item(order=order, product=product_1, quantity=1)
 
+    api_client.force_authenticate(user)
     created_payment = api_client.post(
-        reverse("payment-process", kwargs={"pk": order.id}),
-        {"gateway": "liqpay"},
+        process_url(order.id),
+        {"gateway": "monobank"},
         format="json",
     )
 
-    gateway = LiqpayPayGateway()
+    gateway = MonobankPayGateway()
 
     payment_token = created_payment.data["payment_token"]
     payment_status = gateway.check_payment_status(payment_token)
@@ -274,115 +236,115 @@ def test_callback_with_invalid_signature(
     data_from_bank = {
         "gateway": payment_status["gateway"],
         "payment_token": payment_status["payment_token"],
-        "signature": "invalid signature",
+        "signature": payment_status["signature"],
         "data": payment_status["data"],
     }
 
-    response = api_client.post(
-        reverse("payment-callback"), data=data_from_bank, format="json"
-    )
+    response = api_client.post(callback_url, data=data_from_bank, format="json")
 
-    assert response.status_code == HTTP_403_FORBIDDEN
-    assert response.data["error"] == "Invalid signature"
+    assert response.status_code == HTTP_202_ACCEPTED
+    assert response.data["status"] in ["success", "failure"]
 
 
+@pytest.mark.parametrize(
+    "gateway, payload, signed, expected_status, error_key, error",
+    [
+        (
+            "liqpay",
+            {"payment_token": "FAKE-TOKEN-123", "status": "success"},
+            False,
+            HTTP_403_FORBIDDEN,
+            "error",
+            "Invalid signature",
+        ),
+        (
+            "liqpay",
+            {"gateway": "liqpay", "status": "pending"},
+            True,
+            HTTP_400_BAD_REQUEST,
+            "error",
+            "Missing payment token in decoded data",
+        ),
+        (
+            "liqpay",
+            {"payment_token": "FAKE-TOKEN-123", "status": "success"},
+            True,
+            HTTP_400_BAD_REQUEST,
+            "detail",
+            "Payment not found",
+        ),
+        (
+            "unknownpay",
+            {"payment_token": "FAKE-TOKEN", "status": "success"},
+            False,
+            HTTP_400_BAD_REQUEST,
+            "gateway",
+            "Gateway not supported",
+        ),
+    ],
+    ids=[
+        "invalid_signature",
+        "without_payment_token",
+        "nonexistent_payment_token",
+        "invalid_gateway",
+    ],
+)
 @pytest.mark.django_db
-def test_callback_with_out_payment_token(
+def test_callback_failures(
     api_client: APIClient,
-    create_user,
-    create_order,
-    create_order_item,
-    create_filled_products,
+    signed_fake_callback: Callable[[dict], tuple[str, str]],
+    gateway: str,
+    payload: dict[str, str],
+    signed: bool,
+    expected_status: int,
+    error_key: str,
+    error: str,
+    callback_url: str,
 ) -> None:
     """
-    Test that the payment callback endpoint returns 400 Forbidden
-    when the provided signature is invalid.
+    Ensure that the callback endpoint rejects:
+    - an invalid signature with 403 Forbidden;
+    - decoded data without a payment token with 400 Bad Request;
+    - a payment token that does not exist with 400 Bad Request;
+    - an unknown gateway with 400 Bad Request.
     """
-    user = create_user()
-    order = create_order.create(user=user)
 
-    product_1, _ = create_filled_products
-    create_order_item(order=order, product=product_1, quantity=1)
+    encoded_data, valid_signature = signed_fake_callback(payload)
+    signature = valid_signature if signed else "invalid signature"
 
-    api_client.force_authenticate(user=user)
+    callback_data = {"gateway": gateway, "data": encoded_data, "signature": signature}
 
-    created_payment = api_client.post(
-        reverse("payment-process", kwargs={"pk": order.id}),
-        {"gateway": "liqpay"},
-        format="json",
-    )
-
-    payload = {
-        "gateway": created_payment.data["gateway"],
-        "status": created_payment.data["status"],
-    }
-
-    json_payload = json.dumps(payload)
-    encoded_data = base64.b64encode(json_payload.encode()).decode()
-
-    gateway = LiqpayPayGateway()
-    signature = gateway._generate_signature(encoded_data)
-
-    bad_encoded_data = base64.b64encode(json.dumps(payload).encode()).decode()
-
-    data_from_bank = {
-        "gateway": "liqpay",
-        "data": bad_encoded_data,
-        "signature": signature,
-    }
+    response = api_client.post(callback_url, data=callback_data, format="json")
 
-    response = api_client.post(
-        reverse("payment-callback"), data=data_from_bank, format="json"
-    )
+    assert response.status_code == expected_status
 
-    assert response.status_code == HTTP_400_BAD_REQUEST
-    assert response.data["error"] == "Missing payment token in decoded data"
+    detail = response.data[error_key]
+    if isinstance(detail, list):
+        detail = detail[0]
+    assert detail == error
 
 
 @pytest.mark.django_db
-def test_callback_invalid_gateway(
+def test_callback_with_non_ascii_signature(
     api_client: APIClient,
-    create_user,
-    create_order,
-    create_order_item,
-    create_filled_products,
+    signed_fake_callback: Callable[[dict], tuple[str, str]],
+    callback_url: str,
 ) -> None:
     """
-    Test that callback returns 400 Bad Request if an unknown gateway is provided.
+    Ensure that a signature with non-ASCII characters is rejected with
+    403 Forbidden rather than failing the constant-time comparison.
     """
 
-    # user = create_user()
-    # order = create_order.create(user=user)
-    #
-    # product_1, _ = create_filled_products
-    # create_order_item(order=order, product=product_1, quantity=1)
-    #
-    # api_client.force_authenticate(user=user)
-    #
-    # created_payment = api_client.post(
-    #     reverse("payment-process", kwargs={"pk": order.id}),
-    #     {"gateway": "liqpay"},
-    #     format="json"
-    # )
-
-    payload = {"payment_token": "FAKE-TOKEN", "status": "success"}
-
-    json_payload = json.dumps(payload)
-    encoded_data = base64.b64encode(json_payload.encode()).decode()
-
-    signature = "invalidsignature"
-
-    data = {
-        "gateway": "unknownpay",  # неизвестный шлюз
-        "data": encoded_data,
-        "signature": signature,
-    }
+    encoded_data, _ = signed_fake_callback(
+        {"payment_token": "FAKE-TOKEN-123", "status": "success"}
+    )
 
-    response = api_client.post(reverse("payment-callback"), data=data, format="json")
+    callback_data = {"gateway": "liqpay", "data": encoded_data, "signature": "підпис"}
 
-    assert response.status_code == HTTP_400_BAD_REQUEST
-    assert "gateway" in response.data
-    assert response.data["gateway"][0] == "Gateway not supported"
+    response = api_client.post(callback_url, data=callback_data, format="json")
+
+    assert response.status_code == HTTP_403_FORBIDDEN
+    assert response.data["error"] == "Invalid signature"
 
 
 @pytest.mark.django_db
@@ -390,8 +352,11 @@ def test_callback_for_already_processed_payment_returns_info(
     api_client: APIClient,
     create_user: Callable[..., AuthUser],
     create_filled_products: Tuple[Product, Product],
-    create_order_item: Callable[..., OrderItem],
+    create_order_items_bulk: Callable[..., list[OrderItem]],
     create_order: Any,
+    liqpay_gateway: LiqpayPayGateway,
+    process_url: Callable[[int], str],
+    callback_url: str,
 ) -> None:
     """
     Test that the callback endpoint does not update the status of a payment
@@ -406,22 +371,19 @@ def test_callback_for_already_processed_payment_returns_info(
 
     order = create_order.create(user=user)
 
-    order_item_1 = create_order_item(order=order, product=product_1, quantity=2)
-    order_item_2 = create_order_item(order=order, product=product_2, quantity=1)
+    create_order_items_bulk(order, [(product_1, 2), (product_2, 1)])
 
     api_client.force_authenticate(user)
     data_payment = {"gateway": "liqpay"}
     created_payment = api_client.post(
-        reverse("payment-process", kwargs={"pk": order.id}), data_payment, format="json"
+        process_url(order.id), data_payment, format="json"
     )
     payment = Payment.objects.get(payment_token=created_payment.data["payment_token"])
     payment.status = "Success"
     payment.save()
 
-    gateway = LiqpayPayGateway()
-
     payment_token = created_payment.data["payment_token"]
-    payment_status = gateway.check_payment_status(payment_token)
+    payment_status = liqpay_gateway.check_payment_status(payment_token)
 
     data_from_bank = {
         "gateway": payment_status["gateway"],
@@ -430,35 +392,62 @@ def test_callback_for_already_processed_payment_returns_info(
         "data": payment_status["data"],
     }
 
-    response = api_client.post(
-        reverse("payment-callback"), data=data_from_bank, format="json"
-    )
+    response = api_client.post(callback_url, data=data_from_bank, format="json")
     assert response.status_code == HTTP_200_OK
     assert response.data["status"] == "Success"
     assert response.data["message"] == "already processed"
 
 
 @pytest.mark.django_db
-def test_callback_with_nonexistent_payment_token(api_client: APIClient) -> None:
+def test_callback_for_payment_locked_by_another_callback_asks_to_retry(
+    mocker,
+    api_client: APIClient,
+    create_user: Callable[..., AuthUser],
+    create_filled_products: Tuple[Product, Product],
+    create_order_items_bulk: Callable[..., list[OrderItem]],
+    create_order: Any,
+    liqpay_gateway: LiqpayPayGateway,
+    process_url: Callable[[int], str],
+    callback_url: str,
+) -> None:
     """
-    Test that the callback endpoint returns 400 Bad Request
-    if the payment_token does not exist in the database.
+    Test that a callback which finds the pending payment locked by another
+    callback (skipped by select_for_update(skip_locked=True)) gets a 409, so
+    the gateway retries it, and leaves the payment and order pending.
     """
 
-    fake_payment_token = "FAKE-TOKEN-123"
+    user = create_user()
+
+    product_1, product_2 = create_filled_products
 
-    # Собираем payload, в котором есть фейковый токен
-    payload = {"payment_token": fake_payment_token, "status": "success"}
+    order = create_order.create(user=user)
 
-    encoded_data = base64.b64encode(json.dumps(payload).encode()).decode()
+    create_order_items_bulk(order, [(product_1, 2), (product_2, 1)])
 
-    gateway = LiqpayPayGateway()
-    signature = gateway._generate_signature(encoded_data)
+    api_client.force_authenticate(user)
+    created_payment = api_client.post(
+        process_url(order.id), {"gateway": "liqpay"}, format="json"
+    )
 
-    callback_data = {"gateway": "liqpay", "data": encoded_data, "signature": signature}
+    payment_token = created_payment.data["payment_token"]
+    payment_status = liqpay_gateway.check_payment_status(payment_token)
 
-    response = api_client.post(
-        reverse("payment-callback"), data=callback_data, format="json"
+    data_from_bank = {
+        "gateway": payment_status["gateway"],
+        "payment_token": payment_status["payment_token"],
+        "signature": payment_status["signature"],
+        "data": payment_status["data"],
+    }
+
+    # A locked row is skipped, so the locking query finds nothing
+    mocker.patch.object(
+        Payment.objects, "select_for_update", return_value=Payment.objects.none()
     )
-    assert response.status_code == 400
-    assert response.data["detail"] == "Payment not found"
+
+    response = api_client.post(callback_url, data=data_from_bank, format="json")
+    assert response.status_code == HTTP_409_CONFLICT
+    assert response.data == {"status": "pending", "message": "processing"}
+
+    assert Payment.objects.get(payment_token=payment_token).status == "pending"
+    order.refresh_from_db()
+    assert order.status == "pending"
@@ -1,7 +1,13 @@
 import hashlib
+import hmac
+from typing import Any
 
 from django.conf import settings
 
+# Monobank signs with a keyed BLAKE2b MAC, and blake2b accepts keys of at most
+# 64 bytes; the gateway and the verifier must use this same truncated key.
+MONOBANK_MAC_KEY: bytes = settings.MONOBANK_SECRET_KEY.encode()[:64]
+
 
 class SignatureVerifier:
     """
@@ -14,16 +20,36 @@ class SignatureVerifier:
         "monobank": settings.MONOBANK_SECRET_KEY,
     }
 
+    _KEY_BYTES: dict[str, bytes] = {name: key.encode() for name, key in KEYS.items()}
+
+    # Hash states already fed with each gateway's key; copied per call so the
+    # key prefix is never hashed again.
+    _KEYED_DIGESTS: dict[str, Any] = {
+        name: (
+            hashlib.blake2b(key=MONOBANK_MAC_KEY, digest_size=20)
+            if name == "monobank"
+            else hashlib.sha1(key)
+        )
+        for name, key in _KEY_BYTES.items()
+    }
+
     @staticmethod
-    def verify_signature(gateway_name: str, data: str, signature: str) -> bool:
+    def verify_signature(gateway_name: str, data: str | bytes, signature: str) -> bool:
         """
         Verifies the signature for the given payment gateway.
 
         Constructs the expected signature using the pattern: key + data + key,
         hashed with SHA-1, and compares it to the provided signature.
+        Monobank signs with a keyed BLAKE2b MAC instead.
+        Accepts the data already encoded to bytes to avoid re-encoding it.
         """
-        key = SignatureVerifier.KEYS.get(gateway_name)
+        if isinstance(data, str):
+            data = data.encode()
 
-        expected_signature = hashlib.sha1((key + data + key).encode()).hexdigest()
+        digest = SignatureVerifier._KEYED_DIGESTS[gateway_name].copy()
+        digest.update(data)
+        if gateway_name != "monobank":
+            digest.update(SignatureVerifier._KEY_BYTES[gateway_name])
+        expected_signature = digest.hexdigest()
 
-        return signature == expected_signature
+        return hmac.compare_digest(signature.encode(), expected_signature.encode())
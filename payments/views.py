@@ -27,10 +27,11 @@ class PaymentViewSet(GenericViewSet):
 
     def get_queryset(self):
         """
-        Returns a queryset of orders with 'pending' status,
-        prefetching related order items for performance optimization.
+        Returns a queryset of orders with 'pending' status, loading only the
+        columns needed for the ownership check. The order total is aggregated
+        in the database, so items are not prefetched.
         """
-        return Order.objects.filter(status="pending").prefetch_related("items")
+        return Order.objects.filter(status="pending").only("id", "user_id", "status")
 
     @action(
         detail=True,
@@ -70,6 +71,16 @@ class PaymentViewSet(GenericViewSet):
         )
         return Response(payment_data, status=status.HTTP_201_CREATED)
 
+    @staticmethod
+    def _invalid_signature_response() -> Response:
+        """
+        Logs and builds the 403 response for a callback with a bad signature.
+        """
+        logger.warning(f"Invalid signature")
+        return Response(
+            {"error": "Invalid signature"}, status=status.HTTP_403_FORBIDDEN
+        )
+
     @action(detail=False, methods=["post"], permission_classes=[])
     def callback(self, request):
         """
@@ -84,23 +95,36 @@ class PaymentViewSet(GenericViewSet):
             200 if the payment was already processed,
             202 if the payment is still being processed.
         """
+        raw_gateway = request.data.get("gateway")
+        raw_data = request.data.get("data")
+        raw_signature = request.data.get("signature")
+
+        # Well-formed callbacks from a known gateway are checked before the
+        # serializer runs, so forged callbacks are rejected cheaply.
+        prechecked = (
+            isinstance(raw_gateway, str)
+            and raw_gateway in SignatureVerifier.KEYS
+            and isinstance(raw_data, str)
+            and isinstance(raw_signature, str)
+        )
+        if prechecked and not SignatureVerifier.verify_signature(
+            raw_gateway, raw_data, raw_signature
+        ):
+            return self._invalid_signature_response()
+
         serializer = CallbackSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         gateway_name = serializer.validated_data["gateway"]
-        encoded_data = serializer.validated_data["data"]
+        encoded_data = serializer.validated_data["data"].encode()
         signature = serializer.validated_data["signature"]
 
-        if not SignatureVerifier.verify_signature(
+        if not prechecked and not SignatureVerifier.verify_signature(
             gateway_name, encoded_data, signature
         ):
-            logger.warning(f"Invalid signature")
-            return Response(
-                {"error": "Invalid signature"}, status=status.HTTP_403_FORBIDDEN
-            )
+            return self._invalid_signature_response()
 
-        decoded_data = base64.b64decode(encoded_data).decode()
-        payload = json.loads(decoded_data)
+        payload = json.loads(base64.b64decode(encoded_data))
 
         payment_token = payload.get("payment_token")
 
@@ -113,4 +137,9 @@ class PaymentViewSet(GenericViewSet):
         if payment_status.get("message") == "already processed":
             return Response(payment_status, status=status.HTTP_200_OK)
 
+        # Another callback is settling the payment; a non-2xx answer keeps the
+        # gateway retrying in case that callback fails and rolls back.
+        if payment_status.get("message") == "processing":
+            return Response(payment_status, status=status.HTTP_409_CONFLICT)
+
         return Response(payment_status, status=status.HTTP_202_ACCEPTED)
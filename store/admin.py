@@ -1,6 +1,7 @@
 from typing import Optional
 
 from django.contrib import admin, messages
+from django.db.models import Prefetch
 from django.db.models.query import QuerySet
 from django_object_actions import DjangoObjectActions
 
@@ -208,7 +209,13 @@ class ProductAdmin(PreviewDescriptionMixin, DjangoObjectActions, admin.ModelAdmi
             super()
             .get_queryset(request)
             .select_related("category", "vendor")
-            .prefetch_related("industry", "product_type")
+            .defer("category__description", "vendor__description")
+            .prefetch_related(
+                Prefetch("industry", queryset=Industry.objects.only("id", "name")),
+                Prefetch(
+                    "product_type", queryset=ProductType.objects.only("id", "name")
+                ),
+            )
         )
 
     @admin.display(description="Category", ordering="category__name")
@@ -230,32 +237,36 @@ class ProductAdmin(PreviewDescriptionMixin, DjangoObjectActions, admin.ModelAdmi
         """
         Return names of ProductTypes
         """
-        return (
-            ",".join(obj.product_type.values_list("name", flat=True))
-            if obj.product_type.exists()
-            else "---"
-        )
+        return ",".join(item.name for item in obj.product_type.all()) or "---"
 
     @admin.display(description="Industry", ordering="industry__name")
     def get_industry(self, obj: Product) -> str:
         """
         Return names of industries
         """
-        return (
-            ",".join(obj.industry.values_list("name", flat=True))
-            if obj.industry.exists()
-            else "---"
-        )
+        return ",".join(item.name for item in obj.industry.all()) or "---"
+
+    def _collect_product_ctx(self, request, obj: Product) -> dict:
+        """
+        Build the generate_product_description arguments. The action view
+        loads the product through the default manager, so it is reloaded
+        through get_queryset to read the relations in one select_related
+        query and two prefetches.
+        """
+        product = self.get_queryset(request).get(pk=obj.pk)
+        return {
+            "product_name": product.name,
+            "product_description": product.description,
+            "price": product.price,
+            "category": product.category.name if product.category_id else "---",
+            "vendor": product.vendor.name if product.vendor_id else "---",
+            "industry": self.get_industry(product),
+            "product_type": self.get_product_type(product),
+        }
 
     def generate_ai_description(self, request, obj):
         generated_text = generate_product_description(
-            obj.name,
-            obj.description,
-            obj.price,
-            self.get_category(obj),
-            self.get_vendor(obj),
-            self.get_industry(obj),
-            self.get_product_type(obj),
+            **self._collect_product_ctx(request, obj)
         )
 
         obj.generated_description = generated_text
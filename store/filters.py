@@ -1,7 +1,10 @@
 import django_filters
+from django import forms
+from django.core.exceptions import ValidationError
+from django.db.models import F, Func, Subquery
 from django_filters.rest_framework import DjangoFilterBackend
 
-from .models import Category, Industry, Product, ProductType, Vendor
+from .models import Category, Product
 
 
 class SafeDjangoFilterBackend(DjangoFilterBackend):
@@ -10,26 +13,87 @@ class SafeDjangoFilterBackend(DjangoFilterBackend):
 
     If the filter parameters are invalid, returns an empty queryset instead of raising an exception.
     Prevents filter errors from exposing sensitive data or breaking the API response.
+    Requests without any filter parameters skip building the filterset.
     """
 
     def filter_queryset(self, request, queryset, view):
-        filterset = self.get_filterset(request, queryset, view)
+        filterset_class = self.get_filterset_class(view, queryset)
+        if filterset_class is None or filterset_class.base_filters.keys().isdisjoint(
+            request.query_params
+        ):
+            return queryset
+
+        # get_filterset() would resolve the filterset class a second time
+        filterset = filterset_class(
+            **self.get_filterset_kwargs(request, queryset, view)
+        )
         if not filterset.is_valid():
             return queryset.none()
         return filterset.qs
 
 
+class IntegerListField(forms.Field):
+    """
+    Form field for repeated integer query parameters (`?x=1&x=2`).
+    Values are only type-checked, not looked up in the database.
+    """
+
+    widget = forms.SelectMultiple
+    default_error_messages = {"invalid": "Enter a list of whole numbers."}
+
+    def to_python(self, value) -> list[int]:
+        if not value:
+            return []
+        try:
+            return [int(item) for item in value]
+        except (TypeError, ValueError):
+            raise ValidationError(self.error_messages["invalid"], code="invalid")
+
+
+class ActiveRelatedFilter(django_filters.Filter):
+    """
+    Filters by primary keys of active related objects.
+
+    Like ModelMultipleChoiceFilter, one unknown or inactive id makes the whole
+    filter match nothing. The ids are not validated with a separate SELECT:
+    the number of active objects among them is counted in a subquery of the
+    main query and compared with the number of distinct ids submitted.
+    """
+
+    field_class = IntegerListField
+
+    def filter(self, qs, value):
+        if not value:
+            return qs
+        ids = set(value)
+        related_model = qs.model._meta.get_field(self.field_name).related_model
+        active_count = (
+            related_model._default_manager.filter(pk__in=ids, is_active=True)
+            .order_by()
+            .annotate(count=Func(F("pk"), function="COUNT"))
+            .values("count")
+        )
+        qs = qs.alias(**{f"{self.field_name}_active_count": Subquery(active_count)})
+        qs = qs.filter(
+            **{
+                f"{self.field_name}__in": ids,
+                f"{self.field_name}_active_count": len(ids),
+            }
+        )
+        return qs.distinct() if self.distinct else qs
+
+
 class ProductFilter(django_filters.FilterSet):
     """
     FilterSet for filtering products based on various criteria.
 
     Filters:
         - category (ModelChoiceFilter): Filters products by category.
-        - vendor (ModelMultipleChoiceFilter): Filters products by vendor.
+        - vendor (ActiveRelatedFilter): Filters products by vendor.
         - price_min (NumberFilter): Filters products with a price greater than or equal to the specified value.
         - price_max (NumberFilter): Filters products with a price less than or equal to the specified value.
-        - product_type (ModelMultipleChoiceFilter): Filters products by multiple product types.
-        - industry (ModelMultipleChoiceFilter): Filters products by multiple industries.
+        - product_type (ActiveRelatedFilter): Filters products by multiple product types.
+        - industry (ActiveRelatedFilter): Filters products by multiple industries.
 
     Usage:
         - Supports filtering by individual or multiple values.
@@ -50,11 +114,7 @@ class ProductFilter(django_filters.FilterSet):
         required=False,
     )
 
-    vendor = django_filters.ModelMultipleChoiceFilter(
-        field_name="vendor",
-        queryset=Vendor.objects.filter(is_active=True),
-        required=False,
-    )
+    vendor = ActiveRelatedFilter(field_name="vendor", required=False)
 
     price_min = django_filters.NumberFilter(
         field_name="price", lookup_expr="gte", required=False
@@ -63,17 +123,15 @@ class ProductFilter(django_filters.FilterSet):
         field_name="price", lookup_expr="lte", required=False
     )
 
-    product_type = django_filters.ModelMultipleChoiceFilter(
+    product_type = ActiveRelatedFilter(
         field_name="product_type",
-        queryset=ProductType.objects.filter(is_active=True),
-        conjoined=False,
+        distinct=True,
         required=False,
     )
 
-    industry = django_filters.ModelMultipleChoiceFilter(
+    industry = ActiveRelatedFilter(
         field_name="industry",
-        queryset=Industry.objects.filter(is_active=True),
-        conjoined=False,
+        distinct=True,
         required=False,
     )
 
@@ -41,7 +41,7 @@ class Migration(migrations.Migration):
                 (
                     "image",
                     models.ImageField(
-                        upload_to=store.models.Carousel.carousel_image_upload_path,
+                        upload_to=store.models.NameUploadTo("carousels"),
                         verbose_name="Carousel image",
                     ),
                 ),
@@ -100,7 +100,7 @@ class Migration(migrations.Migration):
                     "image",
                     models.ImageField(
                         blank=True,
-                        upload_to=store.models.Industry.industry_image_upload_path,
+                        upload_to=store.models.NameUploadTo("industries"),
                         verbose_name="Industry image",
                     ),
                 ),
@@ -216,7 +216,7 @@ class Migration(migrations.Migration):
                 (
                     "image",
                     models.ImageField(
-                        upload_to=store.models.Vendor.vendor_image_upload_path,
+                        upload_to=store.models.NameUploadTo("vendors"),
                         verbose_name="Vendor Image",
                     ),
                 ),
@@ -271,7 +271,7 @@ class Migration(migrations.Migration):
                 (
                     "image",
                     models.ImageField(
-                        upload_to=store.models.Category.category_image_upload_path,
+                        upload_to=store.models.NameUploadTo("categories"),
                         verbose_name="Category image",
                     ),
                 ),
@@ -345,7 +345,7 @@ class Migration(migrations.Migration):
                 (
                     "image",
                     models.ImageField(
-                        upload_to=store.models.Product.product_image_upload_path,
+                        upload_to=store.models.NameUploadTo("products"),
                         verbose_name="Product Image",
                     ),
                 ),
@@ -407,7 +407,7 @@ class Migration(migrations.Migration):
                 (
                     "photo",
                     models.ImageField(
-                        upload_to=store.models.ProductImages.product_extra_image_upload_path,
+                        upload_to=store.models.product_extra_image_upload_path,
                         verbose_name="Product image",
                     ),
                 ),
@@ -0,0 +1,40 @@
+# Generated by Django 5.1.5 on 2026-10-15 22:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("store", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["is_active", "category", "price"], name="idx_prod_act_cat_price"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["is_active", "vendor", "price"],
+                name="idx_prod_act_vendor_price",
+            ),
+        ),
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX idx_prod_industry_rev "
+                "ON store_product_industry (industry_id, product_id);"
+            ),
+            reverse_sql="DROP INDEX idx_prod_industry_rev;",
+        ),
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX idx_prod_type_rev "
+                "ON store_product_product_type (producttype_id, product_id);"
+            ),
+            reverse_sql="DROP INDEX idx_prod_type_rev;",
+        ),
+    ]
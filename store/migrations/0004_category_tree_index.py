@@ -0,0 +1,17 @@
+# Generated by Django 5.1.5 on 2026-10-15 22:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("store", "0003_product_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(fields=["tree_id", "lft"], name="idx_category_tree_lft"),
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 5.1.5 on 2026-10-15 23:02
+
+from django.contrib.postgres.operations import (AddIndexConcurrently,
+                                               RemoveIndexConcurrently)
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("store", "0004_category_tree_index"),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name="product",
+            name="idx_product_active_ordering",
+        ),
+        AddIndexConcurrently(
+            model_name="carousel",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["ordering", "-time_created"],
+                name="idx_carousel_active_ordering",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="category",
+            index=models.Index(
+                condition=models.Q(("is_active", True), ("parent__isnull", True)),
+                fields=["ordering"],
+                name="idx_category_active_roots",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="industry",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["ordering"],
+                name="idx_industry_active_ordering",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="product",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["ordering"],
+                name="idx_product_active_ordering",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="producttype",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["ordering", "-time_created"],
+                name="idx_prodtype_active_ordering",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="vendor",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["ordering"],
+                name="idx_vendor_active_ordering",
+            ),
+        ),
+    ]
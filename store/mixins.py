@@ -1,28 +1,65 @@
 from typing import Any, Optional
 
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.db.models.functions import Substr
 from rest_framework.viewsets import GenericViewSet
 
-from .utils import render_image_preview, short_description
+from .utils import (SHORT_DESCRIPTION_LENGTH, render_image_preview,
+                    short_description)
 
 
 class IsActiveQuerysetMixin(GenericViewSet):
+    """
+    Limits the queryset to active objects for non-staff users.
+
+    If the view set's serializer defines a `setup_eager_loading(queryset)`
+    classmethod, it is applied so the related objects the serializer reads
+    are loaded up front instead of per row.
+    """
 
     def get_queryset(self):
         """
-        Returns only active objects for non-staff users.
+        Returns only active objects for non-staff users, with the related
+        objects of the serializer loaded.
         """
         queryset = super().get_queryset()
-        if not (self.request.user.is_authenticated and self.request.user.is_staff):
+        setup_eager_loading = getattr(
+            self.get_serializer_class(), "setup_eager_loading", None
+        )
+        if setup_eager_loading is not None:
+            queryset = setup_eager_loading(queryset)
+        user = self.request.user
+        if user.is_anonymous or not user.is_staff:
             return queryset.filter(is_active=True)
         return queryset
 
 
+class PreviewChangeList(ChangeList):
+    """
+    Changelist that loads only the head of each description.
+
+    The list shows a truncated description, so the database cuts it to
+    `description_preview` and the full column is deferred.
+    """
+
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        return queryset.annotate(
+            description_preview=Substr(
+                "description", 1, SHORT_DESCRIPTION_LENGTH + 1
+            )
+        ).defer("description")
+
+
 class PreviewDescriptionMixin:
     """
     Mixin for providing methods for displaying a preview and a short description.
     """
 
+    def get_changelist(self, request, **kwargs):
+        return PreviewChangeList
+
     @admin.display(description="preview")
     def image_admin_preview(self, obj: Any) -> Optional[str]:
         """
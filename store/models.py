@@ -1,27 +1,105 @@
-from typing import Type
-
 from django.conf import settings
 from django.db import models
+from django.utils.deconstruct import deconstructible
 from django.utils.html import strip_tags
 from django.utils.text import slugify
 from django_ckeditor_5.fields import CKEditor5Field
 from mptt.models import MPTTModel, TreeForeignKey
 
 
-class Carousel(models.Model):
+def upload_dir(name: str | None) -> str:
     """
-    Represents a carousel sliders used for displaying images with optional descriptions and links.
+    Turn an object name into a filesystem-safe upload directory.
+    Unicode letters are kept so Cyrillic names do not collapse to "".
+    """
+    return slugify(name or "", allow_unicode=True) or "undefined"
+
+
+@deconstructible
+class NameUploadTo:
+    """
+    upload_to callable storing files under img/<prefix>/<slug of instance.name>/.
+    Deconstructible, so migrations reference it by import path and prefix.
+    """
+
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix
+
+    def __call__(self, instance: models.Model, filename: str) -> str:
+        return f"img/{self.prefix}/{upload_dir(instance.name)}/{filename}"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, NameUploadTo) and self.prefix == other.prefix
+
+    def __hash__(self) -> int:
+        return hash(self.prefix)
+
+
+def product_extra_image_upload_path(instance: "ProductImages", filename: str) -> str:
+    """
+    Generate the upload path for the product extra image.
+    Uses the already loaded product if there is one, otherwise reads only
+    its name instead of fetching the whole row.
+    """
+    if instance.product_id is None:
+        product_name = None
+    elif instance._meta.get_field("product").is_cached(instance):
+        product_name = instance.product.name
+    else:
+        product_name = (
+            Product.objects.filter(pk=instance.product_id)
+            .values_list("name", flat=True)
+            .first()
+        )
+    return f"img/products/{upload_dir(product_name)}/{filename}"
+
+
+class StripTagsOnSaveMixin:
+    """
+    Strips all HTML tags from `strip_tags_field` before saving the instance.
+
+    The field's value is remembered when the instance is loaded or saved, so
+    saves that leave it untouched skip stripping an already clean value.
     """
 
-    def carousel_image_upload_path(instance: "Carousel", filename: str) -> str:
+    strip_tags_field: str = "description"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._clean_markup = instance.__dict__.get(cls.strip_tags_field)
+        return instance
+
+    def save(self, *args, **kwargs) -> None:
+        value = self.__dict__.get(self.strip_tags_field)
+        if value and value != getattr(self, "_clean_markup", None):
+            value = strip_tags(value)
+            setattr(self, self.strip_tags_field, value)
+        super().save(*args, **kwargs)
+        self._clean_markup = value
+
+    @classmethod
+    def bulk_create_clean(cls, objs, **kwargs) -> list:
         """
-        Generate the upload path for the carousel image
+        bulk_create() bypasses save(), so strip the tags of all objects here
+        before inserting them in bulk.
         """
-        return f"img/carousels/{instance.name}/{filename}"
+        field = cls.strip_tags_field
+        for obj in objs:
+            value = obj.__dict__.get(field)
+            if value:
+                setattr(obj, field, strip_tags(value))
+        return cls._default_manager.bulk_create(objs, **kwargs)
+
+
+class Carousel(StripTagsOnSaveMixin, models.Model):
+    """
+    Represents a carousel sliders used for displaying images with optional descriptions and links.
+    """
 
     name = models.CharField(max_length=255, verbose_name="Slider", unique=True)
     description = CKEditor5Field(blank=True, verbose_name="Slider description")
-    image = models.ImageField("Carousel image", upload_to=carousel_image_upload_path)
+    image = models.ImageField("Carousel image", upload_to=NameUploadTo("carousels"))
     url = models.URLField(
         max_length=255, verbose_name="Slider URL", blank=True, null=True
     )
@@ -38,14 +116,6 @@ class Carousel(models.Model):
         """
         return self.name
 
-    def save(self, *args, **kwargs) -> None:
-        """
-        Strips all HTML tags from the description field before saving the instance.
-        """
-        if self.description:
-            self.description = strip_tags(self.description)
-        super().save(*args, **kwargs)
-
     class Meta:
         """
         Meta options for the Carousel model.
@@ -54,25 +124,25 @@ class Carousel(models.Model):
         verbose_name = "Slider"
         verbose_name_plural = "Sliders"
         ordering = ["ordering", "-time_created"]
+        indexes = [
+            models.Index(
+                fields=["ordering", "-time_created"],
+                condition=models.Q(is_active=True),
+                name="idx_carousel_active_ordering",
+            ),
+        ]
 
 
-class Category(MPTTModel):
+class Category(StripTagsOnSaveMixin, MPTTModel):
     """
     Represents a hierarchical category structure using MPTT.
     """
 
-    def category_image_upload_path(instance: "Category", filename: str) -> str:
-        """
-        Generate the upload path for the category image
-        """
-
-        return f"img/categories/{instance.name}/{filename}"
-
     name = models.CharField(
         max_length=100, db_index=True, unique=True, verbose_name="Category name"
     )
     description = CKEditor5Field(blank=True, verbose_name="Category description")
-    image = models.ImageField("Category image", upload_to=category_image_upload_path)
+    image = models.ImageField("Category image", upload_to=NameUploadTo("categories"))
     ordering = models.PositiveSmallIntegerField(
         default=0, verbose_name="Ordering", help_text="Ordering in category list"
     )
@@ -88,38 +158,34 @@ class Category(MPTTModel):
     def __str__(self):
         return self.name
 
-    def save(self, *args, **kwargs) -> None:
-        """
-        Strips all HTML tags from the description field before saving the instance.
-        """
-        if self.description:
-            self.description = strip_tags(self.description)
-        super().save(*args, **kwargs)
-
     class Meta:
         verbose_name: str = "Category"
         verbose_name_plural: str = "Categories"
+        # django-mptt only adds this index itself on Django < 5; tree reads
+        # such as get_descendants() range-scan lft within a tree_id.
+        indexes = [
+            models.Index(fields=["tree_id", "lft"], name="idx_category_tree_lft"),
+            # root categories shown to customers
+            models.Index(
+                fields=["ordering"],
+                condition=models.Q(parent__isnull=True, is_active=True),
+                name="idx_category_active_roots",
+            ),
+        ]
 
     class MPTTMeta:
         order_insertion_by: list[str] = ["ordering", "-time_created"]
 
 
-class Industry(models.Model):
+class Industry(StripTagsOnSaveMixin, models.Model):
     """
     Represents an industries used for displaying additional information about industries and filtering products.
     """
 
-    def industry_image_upload_path(instance: Type["Industry"], filename: str) -> str:
-        """
-        Generate the upload path for the industry image
-        """
-
-        return f"img/industries/{instance.name}/{filename}"
-
     name = models.CharField(max_length=100, db_index=True, verbose_name="Industry name")
     description = CKEditor5Field(blank=True, verbose_name="Industry description")
     image = models.ImageField(
-        upload_to=industry_image_upload_path, blank=True, verbose_name="Industry image"
+        upload_to=NameUploadTo("industries"), blank=True, verbose_name="Industry image"
     )
     ordering = models.PositiveSmallIntegerField(
         default=0, verbose_name="Industry ordering"
@@ -135,28 +201,21 @@ class Industry(models.Model):
         verbose_name = "Industry"
         verbose_name_plural = "Industries"
         ordering = ["ordering"]
+        indexes = [
+            models.Index(
+                fields=["ordering"],
+                condition=models.Q(is_active=True),
+                name="idx_industry_active_ordering",
+            ),
+        ]
 
-    def save(self, *args, **kwargs) -> None:
-        """
-        Strips all HTML tags from the description field before saving the instance.
-        """
-        if self.description:
-            self.description = strip_tags(self.description)
-        super().save(*args, **kwargs)
-
-
-class Vendor(models.Model):
 
-    def vendor_image_upload_path(instance: Type["Vendor"], filename: str) -> str:
-        """
-        Generate the upload path for the vendor image
-        """
-        return f"img/vendors/{instance.name}/{filename}"
+class Vendor(StripTagsOnSaveMixin, models.Model):
 
     name = models.CharField(max_length=100, db_index=True, verbose_name="Vendor name")
     description = models.TextField(blank=True, verbose_name="Vendor description")
     image = models.ImageField(
-        upload_to=vendor_image_upload_path, verbose_name="Vendor Image"
+        upload_to=NameUploadTo("vendors"), verbose_name="Vendor Image"
     )
     ordering = models.PositiveSmallIntegerField(
         default=0, verbose_name="Vendor ordering"
@@ -172,17 +231,16 @@ class Vendor(models.Model):
         verbose_name = "Vendor"
         verbose_name_plural = "Vendors"
         ordering = ["ordering"]
-
-    def save(self, *args, **kwargs) -> None:
-        """
-        Strips all HTML tags from the description field before saving the instance.
-        """
-        if self.description:
-            self.description = strip_tags(self.description)
-        super().save(*args, **kwargs)
+        indexes = [
+            models.Index(
+                fields=["ordering"],
+                condition=models.Q(is_active=True),
+                name="idx_vendor_active_ordering",
+            ),
+        ]
 
 
-class ProductType(models.Model):
+class ProductType(StripTagsOnSaveMixin, models.Model):
     name = models.CharField(max_length=255, verbose_name="Product type")
     description = CKEditor5Field(blank=True, verbose_name="Product type description")
     ordering = models.PositiveSmallIntegerField(
@@ -199,23 +257,16 @@ class ProductType(models.Model):
         verbose_name = "Product type"
         verbose_name_plural = "Product types"
         ordering = ["ordering", "-time_created"]
+        indexes = [
+            models.Index(
+                fields=["ordering", "-time_created"],
+                condition=models.Q(is_active=True),
+                name="idx_prodtype_active_ordering",
+            ),
+        ]
 
-    def save(self, *args, **kwargs) -> None:
-        """
-        Strips all HTML tags from the description field before saving the instance.
-        """
-        if self.description:
-            self.description = strip_tags(self.description)
-        super().save(*args, **kwargs)
-
-
-class Product(models.Model):
 
-    def product_image_upload_path(instance: "Product", filename: str) -> str:
-        """
-        Generate the upload path for the products main image
-        """
-        return f"img/products/{instance.name}/{filename}"
+class Product(StripTagsOnSaveMixin, models.Model):
 
     name = models.CharField(max_length=100, verbose_name="Product", db_index=True)
     price = models.DecimalField(max_digits=9, decimal_places=2)
@@ -227,7 +278,7 @@ class Product(models.Model):
         config_name="default",
         verbose_name="AI generated product description", blank=True)
     image = models.ImageField(
-        upload_to=product_image_upload_path, verbose_name="Product Image"
+        upload_to=NameUploadTo("products"), verbose_name="Product Image"
     )
     ordering = models.PositiveSmallIntegerField(
         default=0, blank=True, help_text="Use for ordering", db_index=True
@@ -253,10 +304,27 @@ class Product(models.Model):
 
     class Meta:
         indexes = [
+            # customers only ever list active products, so only those are indexed
             models.Index(
-                fields=["is_active", "ordering"], name="idx_product_active_ordering"
+                fields=["ordering"],
+                condition=models.Q(is_active=True),
+                name="idx_product_active_ordering",
             ),
             models.Index(fields=["name"], name="idx_product_name"),
+            models.Index(
+                fields=["is_active", "category", "price"],
+                name="idx_prod_act_cat_price",
+            ),
+            models.Index(
+                fields=["is_active", "vendor", "price"],
+                name="idx_prod_act_vendor_price",
+            ),
+            # price_min / price_max without a category or vendor
+            models.Index(
+                fields=["price"],
+                condition=models.Q(is_active=True),
+                name="idx_product_active_price",
+            ),
         ]
 
         verbose_name = "Product"
@@ -265,27 +333,8 @@ class Product(models.Model):
             "ordering",
         ]
 
-    def save(self, *args, **kwargs) -> None:
-        """
-        Strips all HTML tags from the description field before saving the instance.
-        """
-        if self.description:
-            self.description = strip_tags(self.description)
-        super().save(*args, **kwargs)
-
 
 class ProductImages(models.Model):
-    def product_extra_image_upload_path(
-        instance: "ProductImages", filename: str
-    ) -> str:
-        """
-        Generate the upload path for the product extra image
-        """
-        product_name = (
-            slugify(instance.product.name) if instance.product else "undefined"
-        )
-        return f"img/products/{product_name}/{filename}"
-
     photo = models.ImageField(
         upload_to=product_extra_image_upload_path, verbose_name="Product image"
     )
@@ -308,7 +357,9 @@ class ProductImages(models.Model):
         ordering = ["product", "ordering"]
 
 
-class Review(models.Model):
+class Review(StripTagsOnSaveMixin, models.Model):
+    strip_tags_field = "comment"
+
     product = models.ForeignKey(
         Product, on_delete=models.CASCADE, related_name="reviews"
     )
@@ -339,13 +390,10 @@ class Review(models.Model):
             )
         ]
 
-    def save(self, *args, **kwargs) -> None:
-        if self.comment:
-            self.comment = strip_tags(self.comment)
-        super().save(*args, **kwargs)
 
+class ReviewReply(StripTagsOnSaveMixin, models.Model):
+    strip_tags_field = "comment"
 
-class ReviewReply(models.Model):
     review = models.ForeignKey(Review, on_delete=models.CASCADE, related_name="replies")
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True
@@ -364,8 +412,3 @@ class ReviewReply(models.Model):
         ordering = [
             "-time_created",
         ]
-
-    def save(self, *args, **kwargs):
-        if self.comment:
-            self.comment = strip_tags(self.comment)
-        super().save(*args, **kwargs)
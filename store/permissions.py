@@ -30,19 +30,27 @@ class ReviewPermission(BasePermission):
             return request.user.is_authenticated and not request.user.is_staff
         return True
 
+    @staticmethod
+    def _can_edit(request, obj) -> bool:
+        """
+        Staff can edit anything, owners only their not yet moderated reviews.
+        Compares user_id so the review's user is never loaded for the check.
+        """
+        return request.user.is_staff or (
+            obj.user_id == request.user.pk and not obj.moderated
+        )
+
+    _CHECKERS = {
+        "DELETE": lambda request, obj: request.user.is_staff,
+        "PUT": _can_edit,
+        "PATCH": _can_edit,
+    }
+
     def has_object_permission(self, request, view, obj):
         if request.method in SAFE_METHODS:
             return True
 
-        if request.method == "DELETE":
-            return request.user.is_authenticated and request.user.is_staff
-
-        if request.method in ["PUT", "PATCH"]:
-            if request.user.is_authenticated and request.user.is_staff:
-                return True
-            return (
-                request.user.is_authenticated
-                and obj.user == request.user
-                and not obj.moderated
-            )
-        return False
+        checker = self._CHECKERS.get(request.method)
+        return bool(
+            checker and request.user.is_authenticated and checker(request, obj)
+        )
@@ -1,31 +1,95 @@
+from dataclasses import dataclass
 from decimal import Decimal
 from io import BytesIO
+from typing import Any
 
 import factory
 import pytest
 from django.core.files.uploadedfile import SimpleUploadedFile
 from PIL import Image
-from rest_framework.test import APIClient
+
+from users.models import AuthUser
 
 from ..models import (Carousel, Category, Industry, Product, ProductImages,
                       ProductType, Review, ReviewReply, Vendor)
 
 
-@pytest.fixture
-def api_client():
-    """Api client fixture"""
-    return APIClient()
+def _session_user(django_db_blocker, email: str, **extra_fields):
+    """
+    Creates a user for the whole session and removes it when the session ends.
+    Tests only authenticate with it, so the rows outlive single transactions.
+    """
+    with django_db_blocker.unblock():
+        user = AuthUser.objects.create_user(
+            email=email, password="securepassword123", **extra_fields
+        )
 
+    yield user
 
-@pytest.fixture
-def test_image():
-    """Create a test image"""
+    with django_db_blocker.unblock():
+        user.delete()
+
+
+@pytest.fixture(scope="session")
+def staff_user(django_db_setup, django_db_blocker):
+    """Staff user shared by the store tests"""
+    yield from _session_user(django_db_blocker, "staff_user@example.com", is_staff=True)
+
+
+@pytest.fixture(scope="session")
+def regular_user(django_db_setup, django_db_blocker):
+    """Non-staff user shared by the store tests"""
+    yield from _session_user(django_db_blocker, "regular_user@example.com")
+
+
+@pytest.fixture(scope="session")
+def test_image_bytes() -> bytes:
+    """Encode the test JPEG once per session"""
     file = BytesIO()
     image = Image.new("RGB", (100, 100), "blue")
     image.save(file, "jpeg")
-    file.name = "test_image.jpg"
-    file.seek(0)
-    return SimpleUploadedFile("test_image.jpg", file.read(), content_type="image/jpeg")
+    return file.getvalue()
+
+
+@pytest.fixture
+def test_image(test_image_bytes: bytes) -> SimpleUploadedFile:
+    """Create a test image; a fresh upload object per test, since it is consumed"""
+    return SimpleUploadedFile(
+        "test_image.jpg", test_image_bytes, content_type="image/jpeg"
+    )
+
+
+def bulk_make(factory_cls, size: int, **kwargs) -> list:
+    """
+    Build `size` factory instances and insert them with a single query.
+    Tags are stripped as on save(), but save() itself and post-save signals
+    do not run, so keep create_batch() for MPTT models and related rows.
+    """
+    model = factory_cls._meta.model
+    return model.bulk_create_clean(factory_cls.build_batch(size, **kwargs))
+
+
+def seed_active_and_inactive(factory_cls):
+    """
+    Returns a class-scoped fixture that inserts 3 active and 2 inactive rows
+    once for a class of read-only tests and deletes them when it finishes.
+    Each test still runs in its own transaction on top of these rows.
+    """
+
+    @pytest.fixture(scope="class", autouse=True)
+    def seed(self, django_db_setup, django_db_blocker):
+        with django_db_blocker.unblock():
+            rows = bulk_make(factory_cls, 3, is_active=True)
+            rows += bulk_make(factory_cls, 2, is_active=False)
+
+        yield rows
+
+        with django_db_blocker.unblock():
+            factory_cls._meta.model.objects.filter(
+                pk__in=[row.pk for row in rows]
+            ).delete()
+
+    return seed
 
 
 # Factories for creating objects
@@ -43,9 +107,7 @@ class CarouselFactory(factory.django.DjangoModelFactory):
         lambda obj: f"Test description for {obj.name}"
     )
     image: str = factory.LazyAttribute(lambda obj: f"image_for_{obj.name}.jpeg")
-    url: str = factory.LazyAttribute(
-        lambda obj: f"https://{obj.name.replace(' ', '_').lower()}.com"
-    )
+    url: str = factory.Sequence(lambda n: f"https://test_carousel_{n}.com")
     ordering: int = factory.Sequence(lambda n: n)
 
 
@@ -234,18 +296,20 @@ class DummyImage:
     Simple stub with a .url attribute.
     """
 
+    __slots__ = ("url",)
+
     def __init__(self, url: str) -> None:
         self.url = url
 
 
+@dataclass(slots=True, frozen=True)
 class DummyObj:
     """
     Simple model stub with optional image and description.
     """
 
-    def __init__(self, image=None, description: str | None = None) -> None:
-        self.image = image
-        self.description = description
+    image: Any = None
+    description: str | None = None
 
 
 @pytest.fixture
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import patch, MagicMock
 from decimal import Decimal
+from types import SimpleNamespace
 
 from ..utils import generate_product_description
 
@@ -21,11 +22,10 @@ def test_generate_ai_product_description(mock_openai):
     mock_client = MagicMock()
     mock_openai.return_value = mock_client
 
-    mock_message = MagicMock()
-    mock_message.content = [MagicMock(text="Title: Example\nHook: ...")]
-
-    mock_response = MagicMock()
-    mock_response.output = [mock_message]
+    # plain response object; only the client call itself needs to be a mock
+    mock_response = SimpleNamespace(
+        output=[SimpleNamespace(content=[SimpleNamespace(text="Title: Example\nHook: ...")])]
+    )
 
     mock_client.responses.create.return_value = mock_response
 
@@ -85,8 +85,7 @@ def test_generate_ai_product_description_no_message(mock_openai):
     mock_client = MagicMock()
     mock_openai.return_value = mock_client
 
-    mock_response = MagicMock()
-    mock_response.output = [{}]
+    mock_response = SimpleNamespace(output=[{}])
 
     mock_client.responses.create.return_value = mock_response
 
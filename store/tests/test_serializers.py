@@ -4,6 +4,7 @@ from typing import Callable
 import factory
 import pytest
 
+from ..models import Carousel, Industry, ProductImages, upload_dir
 from ..serializers import CarouselSerializer
 
 logger = logging.getLogger("project")
@@ -70,6 +71,27 @@ def test_serializer_valid_url(test_image: Callable) -> None:
     assert serializer.is_valid(), serializer.errors
 
 
+@pytest.mark.django_db
+def test_serializer_rejects_non_http_url(test_image: Callable) -> None:
+    """
+    Test that the serializer rejects syntactically valid URLs whose scheme
+    is not http or https.
+    """
+    data = {
+        "name": "Ftp Carousel",
+        "description": "Test description",
+        "image": test_image,
+        "url": "ftp://example.com",
+        "ordering": 1,
+        "is_active": True,
+    }
+
+    serializer = CarouselSerializer(data=data)
+
+    assert not serializer.is_valid()
+    assert serializer.errors["url"] == ["Enter a valid URL."]
+
+
 @pytest.mark.django_db
 def test_serializer_strips_html_from_description(
     create_carousel: factory.django.DjangoModelFactory,
@@ -86,3 +108,70 @@ def test_serializer_strips_html_from_description(
     assert "<p>" not in serialized_data["description"]
     assert "Title" in serialized_data["description"]
     assert "Some content" in serialized_data["description"]
+
+
+@pytest.mark.django_db
+def test_changed_description_is_stripped_on_resave(
+    create_carousel: factory.django.DjangoModelFactory,
+) -> None:
+    """
+    Test that HTML tags are stripped when the description of an instance
+    loaded from the database is changed and saved again.
+    """
+    carousel = create_carousel.create(description="<p>Old</p>")
+
+    carousel = Carousel.objects.get(pk=carousel.pk)
+    assert carousel.description == "Old"
+
+    carousel.description = "<b>New</b> content"
+    carousel.save()
+    carousel.refresh_from_db()
+
+    assert carousel.description == "New content"
+
+
+@pytest.mark.django_db
+def test_bulk_create_clean_strips_description() -> None:
+    """
+    Test that objects inserted with bulk_create_clean() have their HTML
+    tags stripped although save() is never called.
+    """
+    Industry.bulk_create_clean(
+        [
+            Industry(name="First", description="<p>One</p>"),
+            Industry(name="Second", description=""),
+        ]
+    )
+
+    assert list(
+        Industry.objects.order_by("name").values_list("description", flat=True)
+    ) == ["One", ""]
+
+
+@pytest.mark.django_db
+def test_product_extra_image_upload_path_reads_only_product_name(
+    django_assert_num_queries: Callable,
+    create_product: factory.django.DjangoModelFactory,
+    create_category: factory.django.DjangoModelFactory,
+    create_vendor: factory.django.DjangoModelFactory,
+) -> None:
+    """
+    Test that the extra image path uses a slug of the product name, reusing
+    an already loaded product and otherwise reading just its name.
+    """
+    product = create_product.create(
+        name="Ноутбук Pro/15",
+        category=create_category.create(),
+        vendor=create_vendor.create(),
+    )
+    upload_to = ProductImages._meta.get_field("photo").upload_to
+
+    with django_assert_num_queries(0):
+        path = upload_to(ProductImages(product=product), "a.jpg")
+    assert path == "img/products/ноутбук-pro15/a.jpg"
+
+    with django_assert_num_queries(1):
+        path = upload_to(ProductImages(product_id=product.id), "a.jpg")
+    assert path == "img/products/ноутбук-pro15/a.jpg"
+
+    assert upload_dir("") == "undefined"
@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+
 import pytest
 from django.utils.safestring import SafeString
 
@@ -56,3 +58,14 @@ def test_short_description_full_or_empty() -> None:
     assert short_description(DummyObj(image=None, description=exact)) == exact
     assert short_description(DummyObj(image=None, description="")) == "No description"
     assert short_description(DummyObj(image=None, description=None)) == "No description"
+
+
+def test_short_description_prefers_changelist_preview() -> None:
+    """
+    Test that short_description uses the `description_preview` annotation
+    when present instead of the full description.
+    """
+
+    obj = SimpleNamespace(description=None, description_preview="z" * 51)
+
+    assert short_description(obj) == "z" * 50 + "..."
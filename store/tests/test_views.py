@@ -1,4 +1,6 @@
 import logging
+from itertools import pairwise
+from operator import itemgetter
 from typing import Callable
 
 import factory
@@ -10,324 +12,371 @@ from rest_framework.status import (HTTP_200_OK, HTTP_201_CREATED,
                                    HTTP_404_NOT_FOUND)
 from rest_framework.test import APIClient
 
+from users.models import AuthUser
 from users.tests.conftest import create_user
 
-from ..models import (Carousel, Category, Industry, Product, ProductImages,
-                      ProductType, Review, ReviewReply, Vendor)
+from ..models import (Category, Industry, Product, ProductImages, ProductType,
+                      ReviewReply)
+from .conftest import (CarouselFactory, IndustryFactory, ProductTypeFactory,
+                       VendorFactory, bulk_make, seed_active_and_inactive)
 
 logger = logging.getLogger("project")
 
 
 # Testing carousel
 @pytest.mark.django_db
-def test_get_carousel_sliders_anonymous(
-        api_client: APIClient, create_carousel: factory.django.DjangoModelFactory
-) -> None:
+class TestCarouselList:
     """
-    Test that anonymous users see only active carousels without restricted fields.
+    Read-only list tests sharing 3 active and 2 inactive carousels.
     """
 
-    create_carousel.create_batch(3, is_active=True)
-    create_carousel.create_batch(2, is_active=False)
+    seed = seed_active_and_inactive(CarouselFactory)
 
-    response = api_client.get(reverse("sliders-list"), format="json")
+    def test_get_carousel_sliders_anonymous(
+            self,
+            api_client: APIClient,
+            django_assert_max_num_queries: Callable,
+    ) -> None:
+        """
+        Test that anonymous users see only active carousels without restricted fields.
+        """
 
-    assert response.status_code == HTTP_200_OK
+        with django_assert_max_num_queries(2):
+            response = api_client.get(reverse("sliders-list"), format="json")
 
-    assert len(response.data) == 3
-    for item in response.data:
-        assert "time_created" not in item
-        assert "time_updated" not in item
-        assert item["is_active"] is True
+        assert response.status_code == HTTP_200_OK
 
+        assert len(response.data) == 3
+        for item in response.data:
+            assert "time_created" not in item
+            assert "time_updated" not in item
+            assert item["is_active"] is True
 
-@pytest.mark.django_db
-def test_get_carousel_sliders_non_staff(
-        api_client: APIClient,
-        create_carousel: factory.django.DjangoModelFactory,
-        create_user: Callable,
-) -> None:
-    """
-    Test that non-staff users see only active carousels without time_created and time_updated.
-    """
-    user = create_user()
+    def test_get_carousel_sliders_non_staff(
+            self,
+            api_client: APIClient,
+            regular_user: AuthUser,
+            django_assert_max_num_queries: Callable,
+    ) -> None:
+        """
+        Test that non-staff users see only active carousels without time_created and time_updated.
+        """
 
-    api_client.force_authenticate(user=user)  # force authenticated mechanism
+        api_client.force_authenticate(user=regular_user)  # force authenticated mechanism
 
-    create_carousel.create_batch(3, is_active=True)
-    create_carousel.create_batch(2, is_active=False)
+        with django_assert_max_num_queries(2):
+            response = api_client.get(reverse("sliders-list"), format="json")
 
-    response = api_client.get(reverse("sliders-list"), format="json")
+        assert response.status_code == HTTP_200_OK
 
-    assert response.status_code == HTTP_200_OK
+        assert len(response.data) == 3
+        for item in response.data:
+            assert "time_created" not in item
+            assert "time_updated" not in item
+            assert item["is_active"] is True
 
-    assert len(response.data) == 3
-    for item in response.data:
-        assert "time_created" not in item
-        assert "time_updated" not in item
-        assert item["is_active"] is True
+    def test_get_carousel_sliders_staff(
+            self,
+            api_client: APIClient,
+            staff_user: AuthUser,
+            django_assert_max_num_queries: Callable,
+    ) -> None:
+        """
+        Test that staff users see all carousels with all fields.
+        """
 
+        api_client.force_authenticate(user=staff_user)  # force authenticated mechanism
 
-@pytest.mark.django_db
-def test_get_carousel_sliders_staff(
-        api_client: APIClient,
-        create_carousel: factory.django.DjangoModelFactory,
-        create_user: Callable,
-) -> None:
-    """
-    Test that staff users see all carousels with all fields.
-    """
+        with django_assert_max_num_queries(2):
+            response = api_client.get(reverse("sliders-list"), format="json")
 
-    user = create_user(is_staff=True)
+        assert response.status_code == HTTP_200_OK
 
-    api_client.force_authenticate(user=user)  # force authenticated mechanism
+        assert len(response.data) == 5
+        for item in response.data:
+            assert "time_created" in item
+            assert "time_updated" in item
 
-    create_carousel.create_batch(3, is_active=True)
-    create_carousel.create_batch(2, is_active=False)
 
-    response = api_client.get(reverse("sliders-list"), format="json")
+# Carousel, industry and vendor endpoints share their create, update, delete
+# and ordering tests; each case is (URL basename, factory, extra create data).
+CATALOG_ENDPOINTS = [
+    pytest.param(
+        "sliders", CarouselFactory, {"url": "https://example.com"}, id="carousel"
+    ),
+    pytest.param("industries", IndustryFactory, {}, id="industry"),
+    pytest.param("vendors", VendorFactory, {}, id="vendor"),
+]
 
-    assert response.status_code == HTTP_200_OK
 
-    assert len(response.data) == 5
-    for item in response.data:
-        assert "time_created" in item
-        assert "time_updated" in item
+def catalog_create_data(model_factory, image, extra_data: dict) -> dict:
+    """
+    Multipart payload for creating an object through a catalog endpoint.
+    """
+    return {
+        "name": f"New {model_factory._meta.model.__name__}",
+        "description": "Created by staff",
+        "image": image,
+        "ordering": 1,
+        "is_active": True,
+        **extra_data,
+    }
 
 
+@pytest.mark.parametrize("basename, model_factory, extra_data", CATALOG_ENDPOINTS)
 @pytest.mark.django_db
-def test_create_carousel_staff(
+def test_create_catalog_entry_staff(
         api_client: APIClient,
-        create_carousel: factory.django.DjangoModelFactory,
-        create_user: Callable,
+        staff_user: AuthUser,
         test_image: Callable,
+        basename: str,
+        model_factory: factory.django.DjangoModelFactory,
+        extra_data: dict,
 ) -> None:
     """
-    Test that staff users can create a carousel.
+    Test that staff users can create a carousel, an industry or a vendor.
     """
 
-    user = create_user(is_staff=True)
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=staff_user)
 
-    data: dict[str, str | bool] = {
-        "name": "Staff Carousel",
-        "description": "Created by staff",
-        "image": test_image,
-        "url": "https://example.com",
-        "ordering": 1,
-        "is_active": True,
-    }
+    data = catalog_create_data(model_factory, test_image, extra_data)
 
-    response = api_client.post(reverse("sliders-list"), data, format="multipart")
+    response = api_client.post(reverse(f"{basename}-list"), data, format="multipart")
 
     assert response.status_code == HTTP_201_CREATED
-    assert Carousel.objects.filter(name="Staff Carousel").exists()
+    assert response.data["name"] == data["name"]
 
 
+@pytest.mark.parametrize("basename, model_factory, extra_data", CATALOG_ENDPOINTS)
 @pytest.mark.django_db
-def test_create_carousel_non_staff(
-        api_client: APIClient, create_user: Callable, test_image: Callable
+def test_create_catalog_entry_non_staff(
+        api_client: APIClient,
+        regular_user: AuthUser,
+        test_image: Callable,
+        basename: str,
+        model_factory: factory.django.DjangoModelFactory,
+        extra_data: dict,
 ) -> None:
     """
-    Test ensure that non-staff users cannot create a carousel.
+    Test ensure that non-staff users cannot create a carousel, an industry
+    or a vendor.
     """
 
-    user = create_user(is_staff=False)
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=regular_user)
 
-    data: dict[str, str | bool] = {
-        "name": "Non staff Carousel",
-        "description": "Created by staff",
-        "image": test_image,
-        "url": "https://example.com",
-        "ordering": 1,
-        "is_active": True,
-    }
+    data = catalog_create_data(model_factory, test_image, extra_data)
 
-    response = api_client.post(reverse("sliders-list"), data, format="multipart")
+    response = api_client.post(reverse(f"{basename}-list"), data, format="multipart")
     assert response.status_code == HTTP_403_FORBIDDEN
-    assert not Carousel.objects.filter(name="Staff Carousel").exists()
+    assert not model_factory._meta.model.objects.filter(name=data["name"]).exists()
 
 
-@pytest.mark.django_db
-def test_create_carousel_anonymous(api_client: APIClient, test_image: Callable) -> None:
+@pytest.mark.parametrize("basename, model_factory, extra_data", CATALOG_ENDPOINTS)
+def test_create_catalog_entry_anonymous(
+        api_client: APIClient,
+        test_image: Callable,
+        basename: str,
+        model_factory: factory.django.DjangoModelFactory,
+        extra_data: dict,
+) -> None:
     """
-    Test ensure that anonymous users cannot create a carousel.
+    Test ensure that anonymous users cannot create a carousel, an industry
+    or a vendor.
     """
 
-    data = {
-        "name": "Non staff Carousel",
-        "description": "Created by staff",
-        "image": test_image,
-        "url": "https://example.com",
-        "ordering": 1,
-        "is_active": True,
-    }
+    data = catalog_create_data(model_factory, test_image, extra_data)
 
-    response = api_client.post(reverse("sliders-list"), data, format="multipart")
+    response = api_client.post(reverse(f"{basename}-list"), data, format="multipart")
     assert response.status_code == HTTP_401_UNAUTHORIZED
-    assert not Carousel.objects.filter(name="Non staff Carousel").exists()
 
 
+@pytest.mark.parametrize("basename, model_factory, extra_data", CATALOG_ENDPOINTS)
 @pytest.mark.django_db
-def test_update_carousel_staff(
+def test_update_catalog_entry_staff(
         api_client: APIClient,
-        create_user: Callable,
-        create_carousel: factory.django.DjangoModelFactory,
+        staff_user: AuthUser,
+        basename: str,
+        model_factory: factory.django.DjangoModelFactory,
+        extra_data: dict,
 ) -> None:
     """
-    Test that a staff user can successfully update a carousel instance
+    Test that a staff user can successfully update a carousel, an industry
+    or a vendor.
     """
 
-    user = create_user(is_staff=True)
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=staff_user)
 
-    carousel = create_carousel.create(is_active=True)
-    updated_data = {"name": "Updated_carousel"}
+    instance = model_factory.create(is_active=True)
+    updated_data = {"name": "Updated_name"}
 
     response = api_client.patch(
-        reverse("sliders-detail", args=[carousel.id]), updated_data, format="json"
+        reverse(f"{basename}-detail", args=[instance.id]), updated_data, format="json"
     )
 
     assert response.status_code == HTTP_200_OK
-    assert Carousel.objects.get(id=carousel.id).name == "Updated_carousel"
+    instance.refresh_from_db()
+    assert instance.name == "Updated_name"
 
 
+@pytest.mark.parametrize("basename, model_factory, extra_data", CATALOG_ENDPOINTS)
 @pytest.mark.django_db
-def test_update_carousel_non_staff(
+def test_update_catalog_entry_non_staff(
         api_client: APIClient,
-        create_user: Callable,
-        create_carousel: factory.django.DjangoModelFactory,
+        regular_user: AuthUser,
+        basename: str,
+        model_factory: factory.django.DjangoModelFactory,
+        extra_data: dict,
 ) -> None:
     """
-    Test ensure that non staff users cannot update a carousel.
+    Test ensure that non staff users cannot update a carousel, an industry
+    or a vendor.
     """
 
-    user = create_user()
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=regular_user)
 
-    carousel = create_carousel.create(is_active=True)
-    initial_name = carousel.name
+    instance = model_factory.create(is_active=True)
+    initial_name = instance.name
 
-    updated_data = {"name": "Updated_carousel"}
+    updated_data = {"name": "Updated_name"}
 
     response = api_client.patch(
-        reverse("sliders-detail", args=[carousel.id]), updated_data, format="json"
+        reverse(f"{basename}-detail", args=[instance.id]), updated_data, format="json"
     )
 
     assert response.status_code == HTTP_403_FORBIDDEN
 
-    carousel.refresh_from_db()
-    assert carousel.name == initial_name
+    instance.refresh_from_db()
+    assert instance.name == initial_name
 
 
+@pytest.mark.parametrize("basename, model_factory, extra_data", CATALOG_ENDPOINTS)
 @pytest.mark.django_db
-def test_update_carousel_anonymous(
-        api_client: APIClient, create_carousel: factory.django.DjangoModelFactory
+def test_update_catalog_entry_anonymous(
+        api_client: APIClient,
+        basename: str,
+        model_factory: factory.django.DjangoModelFactory,
+        extra_data: dict,
 ) -> None:
     """
-    Test ensure that anonymous users cannot update a carousel.
+    Test ensure that anonymous users cannot update a carousel, an industry
+    or a vendor.
     """
 
-    carousel = create_carousel.create(is_active=True)
-    initial_name = carousel.name
+    instance = model_factory.create(is_active=True)
+    initial_name = instance.name
 
-    updated_data = {"name": "Updated_carousel"}
+    updated_data = {"name": "Updated_name"}
 
     response = api_client.patch(
-        reverse("sliders-detail", args=[carousel.id]), updated_data, format="json"
+        reverse(f"{basename}-detail", args=[instance.id]), updated_data, format="json"
     )
 
     assert response.status_code == HTTP_401_UNAUTHORIZED
-    assert carousel.name == initial_name
+
+    instance.refresh_from_db()
+    assert instance.name == initial_name
 
 
+@pytest.mark.parametrize("basename, model_factory, extra_data", CATALOG_ENDPOINTS)
 @pytest.mark.django_db
-def test_delete_carousel_staff(
+def test_delete_catalog_entry_staff(
         api_client: APIClient,
-        create_user: Callable,
-        create_carousel: factory.django.DjangoModelFactory,
+        staff_user: AuthUser,
+        basename: str,
+        model_factory: factory.django.DjangoModelFactory,
+        extra_data: dict,
 ) -> None:
     """
-    Test that staff users can delete a carousel.
+    Test that staff users can delete a carousel, an industry or a vendor.
     """
 
-    user = create_user(is_staff=True)
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=staff_user)
 
-    carousel = create_carousel.create()
+    instance = model_factory.create()
 
-    response = api_client.delete(reverse("sliders-detail", args=[carousel.id]))
+    response = api_client.delete(reverse(f"{basename}-detail", args=[instance.id]))
 
     assert response.status_code == HTTP_204_NO_CONTENT
-    assert not Carousel.objects.filter(id=carousel.id).exists()
+    assert not model_factory._meta.model.objects.filter(id=instance.id).exists()
 
 
+@pytest.mark.parametrize("basename, model_factory, extra_data", CATALOG_ENDPOINTS)
 @pytest.mark.django_db
-def test_delete_carousel_non_staff(
+def test_delete_catalog_entry_non_staff(
         api_client: APIClient,
-        create_user: Callable,
-        create_carousel: factory.django.DjangoModelFactory,
+        regular_user: AuthUser,
+        basename: str,
+        model_factory: factory.django.DjangoModelFactory,
+        extra_data: dict,
 ) -> None:
     """
-    Test ensure that non staff users cannot delete a carousel.
+    Test ensure that non staff users cannot delete a carousel, an industry
+    or a vendor.
     """
 
-    user = create_user()
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=regular_user)
 
-    carousel = create_carousel.create()
+    instance = model_factory.create()
 
-    response = api_client.delete(reverse("sliders-detail", args=[carousel.id]))
+    response = api_client.delete(reverse(f"{basename}-detail", args=[instance.id]))
 
     assert response.status_code == HTTP_403_FORBIDDEN
-    assert Carousel.objects.filter(id=carousel.id).exists()
+    assert model_factory._meta.model.objects.filter(id=instance.id).exists()
 
 
+@pytest.mark.parametrize("basename, model_factory, extra_data", CATALOG_ENDPOINTS)
 @pytest.mark.django_db
-def test_delete_carousel_anonymous(
-        api_client: APIClient, create_carousel: factory.django.DjangoModelFactory
+def test_delete_catalog_entry_anonymous(
+        api_client: APIClient,
+        basename: str,
+        model_factory: factory.django.DjangoModelFactory,
+        extra_data: dict,
 ) -> None:
     """
-    Test ensure that anonymous users cannot delete a carousel.
+    Test ensure that anonymous users cannot delete a carousel, an industry
+    or a vendor.
     """
 
-    carousel = create_carousel.create()
+    instance = model_factory.create()
 
-    response = api_client.delete(reverse("sliders-detail", args=[carousel.id]))
+    response = api_client.delete(reverse(f"{basename}-detail", args=[instance.id]))
 
     assert response.status_code == HTTP_401_UNAUTHORIZED
-    assert Carousel.objects.filter(id=carousel.id).exists()
+    assert model_factory._meta.model.objects.filter(id=instance.id).exists()
 
 
+@pytest.mark.parametrize("basename, model_factory, extra_data", CATALOG_ENDPOINTS)
 @pytest.mark.django_db
-def test_carousel_ordering(
-        api_client: APIClient, create_carousel: factory.django.DjangoModelFactory
+def test_catalog_ordering(
+        api_client: APIClient,
+        basename: str,
+        model_factory: factory.django.DjangoModelFactory,
+        extra_data: dict,
 ) -> None:
     """
-    Test that carousels objects are returned in the correct ordering.
+    Test that carousels, industries and vendors are returned in the correct
+    ordering.
     """
 
-    create_carousel.create(ordering=3, is_active=True)
-    create_carousel.create(ordering=1, is_active=True)
-    create_carousel.create(ordering=5, is_active=True)
-    create_carousel.create(ordering=2, is_active=True)
-    create_carousel.create(ordering=4, is_active=True)
+    bulk_make(
+        model_factory, 5, ordering=factory.Iterator([3, 1, 5, 2, 4]), is_active=True
+    )
 
-    response = api_client.get(reverse("sliders-list"))
+    response = api_client.get(reverse(f"{basename}-list"))
 
     assert response.status_code == HTTP_200_OK
 
-    returned_order = [item["ordering"] for item in response.data]
-    expected_order = sorted(returned_order)
+    returned_order = list(map(itemgetter("ordering"), response.data))
 
-    assert returned_order == expected_order
+    assert all(a <= b for a, b in pairwise(returned_order))
 
 
 # Testing categories
 @pytest.mark.django_db
 def test_get_category_anonymous(
-        api_client: APIClient, create_category: factory.django.DjangoModelFactory
+        api_client: APIClient,
+        create_category: factory.django.DjangoModelFactory,
+        django_assert_max_num_queries: Callable,
 ) -> None:
     """
     Test that anonymous users see only active categories without restricted fields.
@@ -340,7 +389,8 @@ def test_get_category_anonymous(
         is_active=False, parent=cat_inactive_parent
     )
 
-    response = api_client.get(reverse("categories-list"), format="json")
+    with django_assert_max_num_queries(3):
+        response = api_client.get(reverse("categories-list"), format="json")
 
     assert response.status_code == HTTP_200_OK
 
@@ -359,14 +409,14 @@ def test_get_category_anonymous(
 def test_get_category_staff(
         api_client: APIClient,
         create_category: factory.django.DjangoModelFactory,
-        create_user: Callable,
+        staff_user: AuthUser,
+        django_assert_max_num_queries: Callable,
 ) -> None:
     """
     Test that non-staff users see only active categories without time_created and time_updated.
     """
-    user = create_user(is_staff=True)
 
-    api_client.force_authenticate(user=user)  # force authenticated mechanism
+    api_client.force_authenticate(user=staff_user)  # force authenticated mechanism
 
     cat_active_parent = create_category.create_batch(2, is_active=True, parent=None)
     cat_active_child = create_category.create(
@@ -377,7 +427,8 @@ def test_get_category_staff(
         is_active=False, parent=cat_inactive_parent
     )
 
-    response = api_client.get(reverse("categories-list"), format="json")
+    with django_assert_max_num_queries(3):
+        response = api_client.get(reverse("categories-list"), format="json")
 
     assert response.status_code == HTTP_200_OK
 
@@ -395,14 +446,13 @@ def test_get_category_staff(
 
 @pytest.mark.django_db
 def test_create_category_staff(
-        api_client: APIClient, create_user: Callable, test_image: Callable
+        api_client: APIClient, staff_user: AuthUser, test_image: Callable
 ) -> None:
     """
     Test that staff users can create a category.
     """
 
-    user = create_user(is_staff=True)
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=staff_user)
 
     data_category: dict[str, str | bool] = {
         "name": "Staff Category",
@@ -417,19 +467,18 @@ def test_create_category_staff(
     )
 
     assert response.status_code == HTTP_201_CREATED
-    assert Category.objects.filter(name="Staff Category").exists()
+    assert response.data["name"] == "Staff Category"
 
 
 @pytest.mark.django_db
 def test_create_unique_category_staff(
-        api_client: APIClient, create_user: Callable, test_image: Callable
+        api_client: APIClient, staff_user: AuthUser, test_image: Callable
 ) -> None:
     """
     Test that staff users can create a unique category.
     """
 
-    user = create_user(is_staff=True)
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=staff_user)
 
     data_category: dict[str, str | bool] = {
         "name": "Staff Category",
@@ -446,884 +495,413 @@ def test_create_unique_category_staff(
     assert response.status_code == HTTP_201_CREATED
     assert Category.objects.filter(name="Staff Category").exists()
 
-    response = api_client.post(
-        reverse("categories-list"), data_category, format="multipart"
-    )
-    assert response.status_code == HTTP_400_BAD_REQUEST
-
-
-@pytest.mark.django_db
-def test_create_category_as_non_staff(
-        api_client: APIClient, create_user: Callable, test_image: Callable
-) -> None:
-    user = create_user()
-    api_client.force_authenticate(user=user)
-
-    data_category = {"name": "Forbidden Category", "description": "Should fail"}
-    response = api_client.post(
-        reverse("categories-list"), data_category, format="multipart"
-    )
-
-    assert response.status_code == HTTP_403_FORBIDDEN
-    assert not Category.objects.filter(name="Forbidden Category").exists()
-
-
-@pytest.mark.django_db
-def test_create_category_as_anonymous(
-        api_client: APIClient, test_image: Callable
-) -> None:
-    data_category = {"name": "Forbidden Category", "description": "Should fail"}
-    response = api_client.post(
-        reverse("categories-list"), data_category, format="multipart"
-    )
-
-    assert response.status_code == HTTP_401_UNAUTHORIZED
-    assert not Category.objects.filter(name="Staff Carousel").exists()
-
-
-@pytest.mark.django_db
-def test_update_category_staff(
-        api_client: APIClient,
-        create_user: Callable,
-        create_category: factory.django.DjangoModelFactory,
-) -> None:
-    """
-    Test that a staff user can successfully update a category instance
-    """
-
-    user = create_user(is_staff=True)
-    api_client.force_authenticate(user=user)
-
-    category = create_category.create(is_active=True)
-    updated_data = {"name": "Updated_category"}
-
-    response = api_client.patch(
-        reverse("categories-detail", args=[category.id]), updated_data, format="json"
-    )
-
-    assert response.status_code == HTTP_200_OK
-    assert Category.objects.get(id=category.id).name == "Updated_category"
-
-
-@pytest.mark.django_db
-def test_update_category_non_staff(
-        api_client: APIClient,
-        create_user: Callable,
-        create_category: factory.django.DjangoModelFactory,
-) -> None:
-    """
-    Test ensure that non staff users cannot update a category.
-    """
-
-    user = create_user()
-    api_client.force_authenticate(user=user)
-
-    category = create_category.create(is_active=True)
-    updated_data = {"name": "Updated_category"}
-
-    response = api_client.patch(
-        reverse("categories-detail", args=[category.id]), updated_data, format="json"
-    )
-
-    assert response.status_code == HTTP_403_FORBIDDEN
-
-
-@pytest.mark.django_db
-def test_update_carousel_anonymous(
-        api_client: APIClient, create_carousel: factory.django.DjangoModelFactory
-) -> None:
-    """
-    Test ensure that anonymous users cannot update a category.
-    """
-
-    category = create_carousel.create(is_active=True)
-    updated_data = {"name": "Updated_carousel"}
-
-    response = api_client.patch(
-        reverse("sliders-detail", args=[category.id]), updated_data, format="json"
-    )
-
-    assert response.status_code == HTTP_401_UNAUTHORIZED
-
-
-@pytest.mark.django_db
-def test_delete_carousel_staff(
-        api_client: APIClient,
-        create_user: Callable,
-        create_category: factory.django.DjangoModelFactory,
-) -> None:
-    """
-    Test that staff users can delete a category.
-    """
-
-    user = create_user(is_staff=True)
-    api_client.force_authenticate(user=user)
-
-    category = create_category.create()
-
-    response = api_client.delete(reverse("categories-detail", args=[category.id]))
-
-    assert response.status_code == HTTP_204_NO_CONTENT
-    assert not Category.objects.filter(id=category.id).exists()
-
-
-@pytest.mark.django_db
-def test_delete_carousel_non_staff(
-        api_client: APIClient,
-        create_user: Callable,
-        create_category: factory.django.DjangoModelFactory,
-) -> None:
-    """
-    Test ensure that non staff users cannot delete a category.
-    """
-
-    user = create_user()
-    api_client.force_authenticate(user=user)
-
-    category = create_category.create()
-
-    response = api_client.delete(reverse("categories-detail", args=[category.id]))
-
-    assert response.status_code == HTTP_403_FORBIDDEN
-    assert Category.objects.filter(id=category.id).exists()
-
-
-@pytest.mark.django_db
-def test_delete_carousel_anonymous(
-        api_client: APIClient, create_category: factory.django.DjangoModelFactory
-) -> None:
-    """
-    Test ensure that non staff users cannot delete a category.
-    """
-
-    category = create_category.create()
-
-    response = api_client.delete(reverse("categories-detail", args=[category.id]))
-
-    assert response.status_code == HTTP_401_UNAUTHORIZED
-    assert Category.objects.filter(id=category.id).exists()
-
-
-@pytest.mark.django_db
-def test_category_ordering(
-        api_client: APIClient, create_category: factory.django.DjangoModelFactory
-) -> None:
-    """
-    Test that carousels objects are returned in the correct ordering.
-    """
-
-    create_category.create(name="Category A", ordering=2)
-    create_category.create(name="Category B", ordering=1)
-
-    response = api_client.get(reverse("categories-list"), format="json")
-
-    assert response.status_code == HTTP_200_OK
-
-    returned_order = [item["ordering"] for item in response.data]
-    expected_order = sorted(returned_order)
-
-    assert returned_order == expected_order
-
-
-# Testing industries
-@pytest.mark.django_db
-def test_get_industry_anonymous(
-        api_client: APIClient, create_industry: factory.django.DjangoModelFactory
-) -> None:
-    """
-    Test that anonymous users see only active industries without restricted fields.
-    """
-
-    create_industry.create_batch(3, is_active=True)
-    create_industry.create_batch(2, is_active=False)
-
-    response = api_client.get(reverse("industries-list"), format="json")
-
-    assert response.status_code == HTTP_200_OK
-
-    assert len(response.data) == 3
-    for item in response.data:
-        assert "time_created" not in item
-        assert "time_updated" not in item
-        assert item["is_active"] is True
-
-
-@pytest.mark.django_db
-def test_get_industry_sliders_non_staff(
-        api_client: APIClient,
-        create_industry: factory.django.DjangoModelFactory,
-        create_user: Callable,
-) -> None:
-    """
-    Test that non-staff users see only active industry without time_created and time_updated.
-    """
-    user = create_user()
-
-    api_client.force_authenticate(user=user)  # force authenticated mechanism
-
-    create_industry.create_batch(3, is_active=True)
-    create_industry.create_batch(2, is_active=False)
-
-    response = api_client.get(reverse("industries-list"), format="json")
-
-    assert response.status_code == HTTP_200_OK
-
-    assert len(response.data) == 3
-    for item in response.data:
-        assert "time_created" not in item
-        assert "time_updated" not in item
-        assert item["is_active"] is True
-
-
-@pytest.mark.django_db
-def test_get_industries_staff(
-        api_client: APIClient,
-        create_industry: factory.django.DjangoModelFactory,
-        create_user: Callable,
-) -> None:
-    """
-    Test that staff users see all industries with all fields.
-    """
-
-    user = create_user(is_staff=True)
-
-    api_client.force_authenticate(user=user)  # force authenticated mechanism
-
-    create_industry.create_batch(3, is_active=True)
-    create_industry.create_batch(2, is_active=False)
-
-    response = api_client.get(reverse("industries-list"), format="json")
-
-    assert response.status_code == HTTP_200_OK
-
-    assert len(response.data) == 5
-    for item in response.data:
-        assert "time_created" in item
-        assert "time_updated" in item
-
-
-@pytest.mark.django_db
-def test_create_industries_staff(
-        api_client: APIClient,
-        create_industry: factory.django.DjangoModelFactory,
-        create_user: Callable,
-        test_image: Callable,
-) -> None:
-    """
-    Test that staff users can create an industry.
-    """
-
-    user = create_user(is_staff=True)
-    api_client.force_authenticate(user=user)
-
-    data: dict[str, str | bool] = {
-        "name": "Staff Industry",
-        "description": "Created by staff",
-        "image": test_image,
-        "ordering": 1,
-        "is_active": True,
-    }
-
-    response = api_client.post(reverse("industries-list"), data, format="multipart")
-
-    assert response.status_code == HTTP_201_CREATED
-    assert Industry.objects.filter(name="Staff Industry").exists()
-
-
-@pytest.mark.django_db
-def test_create_industry_non_staff(
-        api_client: APIClient, create_user: Callable, test_image: Callable
-) -> None:
-    """
-    Test ensure that non-staff users cannot create an industry.
-    """
-
-    user = create_user(is_staff=False)
-    api_client.force_authenticate(user=user)
-
-    data: dict[str, str | bool] = {
-        "name": "Non staff Industry",
-        "description": "Created by staff",
-        "image": test_image,
-        "ordering": 1,
-        "is_active": True,
-    }
-
-    response = api_client.post(reverse("industries-list"), data, format="multipart")
-    assert response.status_code == HTTP_403_FORBIDDEN
-    assert not Carousel.objects.filter(name="Non staff Industry").exists()
-
-
-@pytest.mark.django_db
-def test_create_industry_anonymous(api_client: APIClient, test_image: Callable) -> None:
-    """
-    Test ensure that anonymous users cannot create an industry.
-    """
-
-    data = {
-        "name": "Non staff Industry",
-        "description": "Created by anonymous",
-        "image": test_image,
-        "ordering": 1,
-        "is_active": True,
-    }
-
-    response = api_client.post(reverse("industries-list"), data, format="multipart")
-    assert response.status_code == HTTP_401_UNAUTHORIZED
-    assert not Carousel.objects.filter(name="Non staff Industry").exists()
-
-
-@pytest.mark.django_db
-def test_update_industry_staff(
-        api_client: APIClient,
-        create_user: Callable,
-        create_industry: factory.django.DjangoModelFactory,
-) -> None:
-    """
-    Test that a staff user can successfully update an industry instance
-    """
-
-    user = create_user(is_staff=True)
-    api_client.force_authenticate(user=user)
-
-    industry = create_industry.create(is_active=True)
-    updated_data = {"name": "Updated_industry"}
-
-    response = api_client.patch(
-        reverse("industries-detail", args=[industry.id]), updated_data, format="json"
-    )
-
-    assert response.status_code == HTTP_200_OK
-    assert Industry.objects.get(id=industry.id).name == "Updated_industry"
-
-
-@pytest.mark.django_db
-def test_update_industry_non_staff(
-        api_client: APIClient,
-        create_user: Callable,
-        create_industry: factory.django.DjangoModelFactory,
-) -> None:
-    """
-    Test ensure that non staff users cannot update an industry.
-    """
-
-    user = create_user()
-    api_client.force_authenticate(user=user)
-
-    industry = create_industry.create(is_active=True)
-    initial_name = industry.name
-
-    updated_data = {"name": "Updated_industry"}
-
-    response = api_client.patch(
-        reverse("industries-detail", args=[industry.id]), updated_data, format="json"
-    )
-
-    assert response.status_code == HTTP_403_FORBIDDEN
-
-    industry.refresh_from_db()
-    assert industry.name == initial_name
-
-
-@pytest.mark.django_db
-def test_update_industry_anonymous(
-        api_client: APIClient, create_industry: factory.django.DjangoModelFactory
-) -> None:
-    """
-    Test ensure that anonymous users cannot update an industry.
-    """
-
-    industry = create_industry.create(is_active=True)
-    initial_name = industry.name
-
-    updated_data = {"name": "Updated_industry"}
-
-    response = api_client.patch(
-        reverse("industries-detail", args=[industry.id]), updated_data, format="json"
-    )
-
-    assert response.status_code == HTTP_401_UNAUTHORIZED
-
-    industry.refresh_from_db()
-    assert industry.name == initial_name
-
-
-@pytest.mark.django_db
-def test_delete_industry_staff(
-        api_client: APIClient,
-        create_user: Callable,
-        create_industry: factory.django.DjangoModelFactory,
-) -> None:
-    """
-    Test that staff users can delete an industry.
-    """
-
-    user = create_user(is_staff=True)
-    api_client.force_authenticate(user=user)
-
-    industry = create_industry.create()
-
-    response = api_client.delete(reverse("industries-detail", args=[industry.id]))
-
-    assert response.status_code == HTTP_204_NO_CONTENT
-    assert not Industry.objects.filter(id=industry.id).exists()
-
-
-@pytest.mark.django_db
-def test_delete_industry_non_staff(
-        api_client: APIClient,
-        create_user: Callable,
-        create_industry: factory.django.DjangoModelFactory,
-) -> None:
-    """
-    Test ensure that non staff users cannot delete an industry.
-    """
-
-    user = create_user()
-    api_client.force_authenticate(user=user)
-
-    industry = create_industry.create()
-
-    response = api_client.delete(reverse("industries-detail", args=[industry.id]))
-
-    assert response.status_code == HTTP_403_FORBIDDEN
-    assert Industry.objects.filter(id=industry.id).exists()
-
-
-@pytest.mark.django_db
-def test_delete_industry_anonymous(
-        api_client: APIClient, create_industry: factory.django.DjangoModelFactory
-) -> None:
-    """
-    Test ensure that anonymous users cannot delete an industry.
-    """
-
-    industry = create_industry.create()
-
-    response = api_client.delete(reverse("industries-detail", args=[industry.id]))
-
-    assert response.status_code == HTTP_401_UNAUTHORIZED
-    assert Industry.objects.filter(id=industry.id).exists()
-
-
-@pytest.mark.django_db
-def test_industries_ordering(
-        api_client: APIClient, create_industry: factory.django.DjangoModelFactory
-) -> None:
-    """
-    Test that industries objects are returned in the correct ordering.
-    """
-
-    create_industry.create(ordering=3, is_active=True)
-    create_industry.create(ordering=1, is_active=True)
-    create_industry.create(ordering=5, is_active=True)
-    create_industry.create(ordering=2, is_active=True)
-    create_industry.create(ordering=4, is_active=True)
-
-    response = api_client.get(reverse("industries-list"))
-
-    assert response.status_code == HTTP_200_OK
-
-    returned_order = [item["ordering"] for item in response.data]
-    expected_order = sorted(returned_order)
-
-    assert returned_order == expected_order
-
-
-# Testing vendors
-@pytest.mark.django_db
-def test_get_vendor_anonymous(
-        api_client: APIClient, create_vendor: factory.django.DjangoModelFactory
-) -> None:
-    """
-    Test that anonymous users see only active vendor without restricted fields.
-    """
-
-    create_vendor.create_batch(3, is_active=True)
-    create_vendor.create_batch(2, is_active=False)
-
-    response = api_client.get(reverse("vendors-list"), format="json")
-
-    assert response.status_code == HTTP_200_OK
-
-    assert len(response.data) == 3
-    for item in response.data:
-        assert "time_created" not in item
-        assert "time_updated" not in item
-        assert item["is_active"] is True
-
-
-@pytest.mark.django_db
-def test_get_vendor_non_staff(
-        api_client: APIClient,
-        create_vendor: factory.django.DjangoModelFactory,
-        create_user: Callable,
-) -> None:
-    """
-    Test that non-staff users see only active vendor without time_created and time_updated.
-    """
-    user = create_user()
-
-    api_client.force_authenticate(user=user)  # force authenticated mechanism
-
-    create_vendor.create_batch(3, is_active=True)
-    create_vendor.create_batch(2, is_active=False)
-
-    response = api_client.get(reverse("vendors-list"), format="json")
-
-    assert response.status_code == HTTP_200_OK
-
-    assert len(response.data) == 3
-    for item in response.data:
-        assert "time_created" not in item
-        assert "time_updated" not in item
-        assert item["is_active"] is True
-
-
-@pytest.mark.django_db
-def test_get_vendor_staff(
-        api_client: APIClient,
-        create_vendor: factory.django.DjangoModelFactory,
-        create_user: Callable,
-) -> None:
-    """
-    Test that staff users see all vendors with all fields.
-    """
-
-    user = create_user(is_staff=True)
-
-    api_client.force_authenticate(user=user)  # force authenticated mechanism
-
-    create_vendor.create_batch(3, is_active=True)
-    create_vendor.create_batch(2, is_active=False)
-
-    response = api_client.get(reverse("vendors-list"), format="json")
-
-    assert response.status_code == HTTP_200_OK
-
-    assert len(response.data) == 5
-    for item in response.data:
-        assert "time_created" in item
-        assert "time_updated" in item
-
-
-@pytest.mark.django_db
-def test_create_vendor_staff(
-        api_client: APIClient,
-        create_vendor: factory.django.DjangoModelFactory,
-        create_user: Callable,
-        test_image: Callable,
-) -> None:
-    """
-    Test that staff users can create a vendor.
-    """
-
-    user = create_user(is_staff=True)
-    api_client.force_authenticate(user=user)
-
-    data: dict[str, str | bool] = {
-        "name": "Staff Vendor",
-        "description": "Created by staff",
-        "image": test_image,
-        "ordering": 1,
-        "is_active": True,
-    }
-
-    response = api_client.post(reverse("vendors-list"), data, format="multipart")
-
-    assert response.status_code == HTTP_201_CREATED
-    assert Vendor.objects.filter(name="Staff Vendor").exists()
-
-
-@pytest.mark.django_db
-def test_create_vendor_non_staff(
-        api_client: APIClient, create_user: Callable, test_image: Callable
-) -> None:
-    """
-    Test ensure that non-staff users cannot create a vendor.
-    """
-
-    user = create_user(is_staff=False)
-    api_client.force_authenticate(user=user)
-
-    data: dict[str, str | bool] = {
-        "name": "Non staff Vendor",
-        "description": "Created by staff",
-        "image": test_image,
-        "ordering": 1,
-        "is_active": True,
-    }
-
-    response = api_client.post(reverse("vendors-list"), data, format="multipart")
-    assert response.status_code == HTTP_403_FORBIDDEN
-    assert not Vendor.objects.filter(name="Non staff Vendor").exists()
+    response = api_client.post(
+        reverse("categories-list"), data_category, format="multipart"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
 
 
 @pytest.mark.django_db
-def test_create_vendor_anonymous(api_client: APIClient, test_image: Callable) -> None:
-    """
-    Test ensure that anonymous users cannot create a vendor.
-    """
+def test_create_category_as_non_staff(
+        api_client: APIClient, regular_user: AuthUser, test_image: Callable
+) -> None:
+    api_client.force_authenticate(user=regular_user)
 
-    data = {
-        "name": "Non staff Vendor",
-        "description": "Created by anonymous",
-        "image": test_image,
-        "ordering": 1,
-        "is_active": True,
-    }
+    data_category = {"name": "Forbidden Category", "description": "Should fail"}
+    response = api_client.post(
+        reverse("categories-list"), data_category, format="multipart"
+    )
+
+    assert response.status_code == HTTP_403_FORBIDDEN
+    assert not Category.objects.filter(name="Forbidden Category").exists()
+
+
+def test_create_category_as_anonymous(
+        api_client: APIClient, test_image: Callable
+) -> None:
+    data_category = {"name": "Forbidden Category", "description": "Should fail"}
+    response = api_client.post(
+        reverse("categories-list"), data_category, format="multipart"
+    )
 
-    response = api_client.post(reverse("vendors-list"), data, format="multipart")
     assert response.status_code == HTTP_401_UNAUTHORIZED
-    assert not Vendor.objects.filter(name="Non staff Vendor").exists()
 
 
 @pytest.mark.django_db
-def test_update_vendor_staff(
+def test_update_category_staff(
         api_client: APIClient,
-        create_user: Callable,
-        create_vendor: factory.django.DjangoModelFactory,
+        staff_user: AuthUser,
+        create_category: factory.django.DjangoModelFactory,
 ) -> None:
     """
-    Test that a staff user can successfully update a vendor instance
+    Test that a staff user can successfully update a category instance
     """
 
-    user = create_user(is_staff=True)
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=staff_user)
 
-    vendor = create_vendor.create(is_active=True)
-    updated_data = {"name": "Updated_vendor"}
+    category = create_category.create(is_active=True)
+    updated_data = {"name": "Updated_category"}
 
     response = api_client.patch(
-        reverse("vendors-detail", args=[vendor.id]), updated_data, format="json"
+        reverse("categories-detail", args=[category.id]), updated_data, format="json"
     )
 
     assert response.status_code == HTTP_200_OK
-    assert Vendor.objects.get(id=vendor.id).name == "Updated_vendor"
+    assert Category.objects.get(id=category.id).name == "Updated_category"
 
 
 @pytest.mark.django_db
-def test_update_vendor_non_staff(
+def test_update_category_non_staff(
         api_client: APIClient,
-        create_user: Callable,
-        create_vendor: factory.django.DjangoModelFactory,
+        regular_user: AuthUser,
+        create_category: factory.django.DjangoModelFactory,
 ) -> None:
     """
-    Test ensure that non staff users cannot update an industry.
+    Test ensure that non staff users cannot update a category.
     """
 
-    user = create_user()
-    api_client.force_authenticate(user=user)
-
-    vendor = create_vendor.create(is_active=True)
-    initial_name = vendor.name
+    api_client.force_authenticate(user=regular_user)
 
-    updated_data = {"name": "Updated_industry"}
+    category = create_category.create(is_active=True)
+    updated_data = {"name": "Updated_category"}
 
     response = api_client.patch(
-        reverse("vendors-detail", args=[vendor.id]), updated_data, format="json"
+        reverse("categories-detail", args=[category.id]), updated_data, format="json"
     )
 
     assert response.status_code == HTTP_403_FORBIDDEN
 
-    vendor.refresh_from_db()
-    assert vendor.name == initial_name
-
 
 @pytest.mark.django_db
-def test_update_vendor_anonymous(
-        api_client: APIClient, create_vendor: factory.django.DjangoModelFactory
+def test_update_category_anonymous(
+        api_client: APIClient, create_carousel: factory.django.DjangoModelFactory
 ) -> None:
     """
-    Test ensure that anonymous users cannot update a vendor.
+    Test ensure that anonymous users cannot update a category.
     """
 
-    vendor = create_vendor.create(is_active=True)
-    initial_name = vendor.name
-
-    updated_data = {"name": "Updated_industry"}
+    category = create_carousel.create(is_active=True)
+    updated_data = {"name": "Updated_carousel"}
 
     response = api_client.patch(
-        reverse("vendors-detail", args=[vendor.id]), updated_data, format="json"
+        reverse("sliders-detail", args=[category.id]), updated_data, format="json"
     )
 
     assert response.status_code == HTTP_401_UNAUTHORIZED
 
-    vendor.refresh_from_db()
-    assert vendor.name == initial_name
-
 
 @pytest.mark.django_db
-def test_delete_vendor_staff(
+def test_delete_category_staff(
         api_client: APIClient,
-        create_user: Callable,
-        create_vendor: factory.django.DjangoModelFactory,
+        staff_user: AuthUser,
+        create_category: factory.django.DjangoModelFactory,
 ) -> None:
     """
-    Test that staff users can delete a vendor.
+    Test that staff users can delete a category.
     """
 
-    user = create_user(is_staff=True)
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=staff_user)
 
-    vendor = create_vendor.create()
+    category = create_category.create()
 
-    response = api_client.delete(reverse("vendors-detail", args=[vendor.id]))
+    response = api_client.delete(reverse("categories-detail", args=[category.id]))
 
     assert response.status_code == HTTP_204_NO_CONTENT
-    assert not Vendor.objects.filter(id=vendor.id).exists()
+    assert not Category.objects.filter(id=category.id).exists()
 
 
 @pytest.mark.django_db
-def test_delete_vendor_non_staff(
+def test_delete_category_non_staff(
         api_client: APIClient,
-        create_user: Callable,
-        create_vendor: factory.django.DjangoModelFactory,
+        regular_user: AuthUser,
+        create_category: factory.django.DjangoModelFactory,
 ) -> None:
     """
-    Test ensure that non staff users cannot delete a vendor.
+    Test ensure that non staff users cannot delete a category.
     """
 
-    user = create_user()
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=regular_user)
 
-    vendor = create_vendor.create()
+    category = create_category.create()
 
-    response = api_client.delete(reverse("vendors-detail", args=[vendor.id]))
+    response = api_client.delete(reverse("categories-detail", args=[category.id]))
 
     assert response.status_code == HTTP_403_FORBIDDEN
-    assert Vendor.objects.filter(id=vendor.id).exists()
+    assert Category.objects.filter(id=category.id).exists()
 
 
 @pytest.mark.django_db
-def test_delete_vendor_anonymous(
-        api_client: APIClient, create_vendor: factory.django.DjangoModelFactory
+def test_delete_category_anonymous(
+        api_client: APIClient, create_category: factory.django.DjangoModelFactory
 ) -> None:
     """
-    Test ensure that anonymous users cannot delete a vendor.
+    Test ensure that anonymous users cannot delete a category.
     """
 
-    vendor = create_vendor.create()
+    category = create_category.create()
 
-    response = api_client.delete(reverse("vendors-detail", args=[vendor.id]))
+    response = api_client.delete(reverse("categories-detail", args=[category.id]))
 
     assert response.status_code == HTTP_401_UNAUTHORIZED
-    assert Vendor.objects.filter(id=vendor.id).exists()
+    assert Category.objects.filter(id=category.id).exists()
 
 
 @pytest.mark.django_db
-def test_vendors_ordering(
-        api_client: APIClient, create_vendor: factory.django.DjangoModelFactory
+def test_category_ordering(
+        api_client: APIClient, create_category: factory.django.DjangoModelFactory
 ) -> None:
     """
-    Test that vendors objects are returned in the correct ordering.
+    Test that carousels objects are returned in the correct ordering.
     """
 
-    create_vendor.create(ordering=3, is_active=True)
-    create_vendor.create(ordering=1, is_active=True)
-    create_vendor.create(ordering=5, is_active=True)
-    create_vendor.create(ordering=2, is_active=True)
-    create_vendor.create(ordering=4, is_active=True)
+    create_category.create(name="Category A", ordering=2)
+    create_category.create(name="Category B", ordering=1)
 
-    response = api_client.get(reverse("vendors-list"))
+    response = api_client.get(reverse("categories-list"), format="json")
 
     assert response.status_code == HTTP_200_OK
 
-    returned_order = [item["ordering"] for item in response.data]
-    expected_order = sorted(returned_order)
+    returned_order = list(map(itemgetter("ordering"), response.data))
 
-    assert returned_order == expected_order
+    assert all(a <= b for a, b in pairwise(returned_order))
 
 
-# Testing product_types
+# Testing industries
 @pytest.mark.django_db
-def test_get_product_types_anonymous(
-        api_client: APIClient, create_product_type: factory.django.DjangoModelFactory
-) -> None:
+class TestIndustryList:
     """
-    Test that anonymous users see only active product_types without restricted fields.
+    Read-only list tests sharing 3 active and 2 inactive industries.
     """
 
-    create_product_type.create_batch(3, is_active=True)
-    create_product_type.create_batch(2, is_active=False)
+    seed = seed_active_and_inactive(IndustryFactory)
 
-    response = api_client.get(reverse("product_types-list"), format="json")
+    def test_get_industry_anonymous(
+            self,
+            api_client: APIClient,
+            django_assert_max_num_queries: Callable,
+    ) -> None:
+        """
+        Test that anonymous users see only active industries without restricted fields.
+        """
 
-    assert response.status_code == HTTP_200_OK
+        with django_assert_max_num_queries(2):
+            response = api_client.get(reverse("industries-list"), format="json")
 
-    assert len(response.data) == 3
-    for item in response.data:
-        assert "time_created" not in item
-        assert "time_updated" not in item
-        assert item["is_active"] is True
+        assert response.status_code == HTTP_200_OK
+
+        assert len(response.data) == 3
+        for item in response.data:
+            assert "time_created" not in item
+            assert "time_updated" not in item
+            assert item["is_active"] is True
+
+    def test_get_industry_sliders_non_staff(
+            self,
+            api_client: APIClient,
+            regular_user: AuthUser,
+            django_assert_max_num_queries: Callable,
+    ) -> None:
+        """
+        Test that non-staff users see only active industry without time_created and time_updated.
+        """
+
+        api_client.force_authenticate(user=regular_user)  # force authenticated mechanism
+
+        with django_assert_max_num_queries(2):
+            response = api_client.get(reverse("industries-list"), format="json")
+
+        assert response.status_code == HTTP_200_OK
+
+        assert len(response.data) == 3
+        for item in response.data:
+            assert "time_created" not in item
+            assert "time_updated" not in item
+            assert item["is_active"] is True
+
+    def test_get_industries_staff(
+            self,
+            api_client: APIClient,
+            staff_user: AuthUser,
+            django_assert_max_num_queries: Callable,
+    ) -> None:
+        """
+        Test that staff users see all industries with all fields.
+        """
+
+        api_client.force_authenticate(user=staff_user)  # force authenticated mechanism
+
+        with django_assert_max_num_queries(2):
+            response = api_client.get(reverse("industries-list"), format="json")
+
+        assert response.status_code == HTTP_200_OK
+
+        assert len(response.data) == 5
+        for item in response.data:
+            assert "time_created" in item
+            assert "time_updated" in item
 
 
+# Testing vendors
 @pytest.mark.django_db
-def test_get_product_types_non_staff(
-        api_client: APIClient,
-        create_product_type: factory.django.DjangoModelFactory,
-        create_user: Callable,
-) -> None:
+class TestVendorList:
     """
-    Test that non-staff users see only active product types without time_created and time_updated.
+    Read-only list tests sharing 3 active and 2 inactive vendors.
     """
-    user = create_user()
 
-    api_client.force_authenticate(user=user)  # force authenticated mechanism
+    seed = seed_active_and_inactive(VendorFactory)
 
-    create_product_type.create_batch(3, is_active=True)
-    create_product_type.create_batch(2, is_active=False)
+    def test_get_vendor_anonymous(
+            self,
+            api_client: APIClient,
+            django_assert_max_num_queries: Callable,
+    ) -> None:
+        """
+        Test that anonymous users see only active vendor without restricted fields.
+        """
 
-    response = api_client.get(reverse("product_types-list"), format="json")
+        with django_assert_max_num_queries(2):
+            response = api_client.get(reverse("vendors-list"), format="json")
 
-    assert response.status_code == HTTP_200_OK
+        assert response.status_code == HTTP_200_OK
 
-    assert len(response.data) == 3
-    for item in response.data:
-        assert "time_created" not in item
-        assert "time_updated" not in item
-        assert item["is_active"] is True
+        assert len(response.data) == 3
+        for item in response.data:
+            assert "time_created" not in item
+            assert "time_updated" not in item
+            assert item["is_active"] is True
+
+    def test_get_vendor_non_staff(
+            self,
+            api_client: APIClient,
+            regular_user: AuthUser,
+            django_assert_max_num_queries: Callable,
+    ) -> None:
+        """
+        Test that non-staff users see only active vendor without time_created and time_updated.
+        """
+
+        api_client.force_authenticate(user=regular_user)  # force authenticated mechanism
+
+        with django_assert_max_num_queries(2):
+            response = api_client.get(reverse("vendors-list"), format="json")
+
+        assert response.status_code == HTTP_200_OK
+
+        assert len(response.data) == 3
+        for item in response.data:
+            assert "time_created" not in item
+            assert "time_updated" not in item
+            assert item["is_active"] is True
+
+    def test_get_vendor_staff(
+            self,
+            api_client: APIClient,
+            staff_user: AuthUser,
+            django_assert_max_num_queries: Callable,
+    ) -> None:
+        """
+        Test that staff users see all vendors with all fields.
+        """
 
+        api_client.force_authenticate(user=staff_user)  # force authenticated mechanism
 
+        with django_assert_max_num_queries(2):
+            response = api_client.get(reverse("vendors-list"), format="json")
+
+        assert response.status_code == HTTP_200_OK
+
+        assert len(response.data) == 5
+        for item in response.data:
+            assert "time_created" in item
+            assert "time_updated" in item
+
+
+# Testing product_types
 @pytest.mark.django_db
-def test_get_product_types_staff(
-        api_client: APIClient,
-        create_product_type: factory.django.DjangoModelFactory,
-        create_user: Callable,
-) -> None:
+class TestProductTypeList:
     """
-    Test that staff users see all product_types with all fields.
+    Read-only list tests sharing 3 active and 2 inactive product types.
     """
 
-    user = create_user(is_staff=True)
+    seed = seed_active_and_inactive(ProductTypeFactory)
 
-    api_client.force_authenticate(user=user)  # force authenticated mechanism
+    def test_get_product_types_anonymous(
+            self,
+            api_client: APIClient,
+            django_assert_max_num_queries: Callable,
+    ) -> None:
+        """
+        Test that anonymous users see only active product_types without restricted fields.
+        """
 
-    create_product_type.create_batch(3, is_active=True)
-    create_product_type.create_batch(2, is_active=False)
+        with django_assert_max_num_queries(2):
+            response = api_client.get(reverse("product_types-list"), format="json")
 
-    response = api_client.get(reverse("product_types-list"), format="json")
+        assert response.status_code == HTTP_200_OK
 
-    assert response.status_code == HTTP_200_OK
+        assert len(response.data) == 3
+        for item in response.data:
+            assert "time_created" not in item
+            assert "time_updated" not in item
+            assert item["is_active"] is True
 
-    assert len(response.data) == 5
-    for item in response.data:
-        assert "time_created" in item
-        assert "time_updated" in item
+    def test_get_product_types_non_staff(
+            self,
+            api_client: APIClient,
+            regular_user: AuthUser,
+            django_assert_max_num_queries: Callable,
+    ) -> None:
+        """
+        Test that non-staff users see only active product types without time_created and time_updated.
+        """
+
+        api_client.force_authenticate(user=regular_user)  # force authenticated mechanism
+
+        with django_assert_max_num_queries(2):
+            response = api_client.get(reverse("product_types-list"), format="json")
+
+        assert response.status_code == HTTP_200_OK
+
+        assert len(response.data) == 3
+        for item in response.data:
+            assert "time_created" not in item
+            assert "time_updated" not in item
+            assert item["is_active"] is True
+
+    def test_get_product_types_staff(
+            self,
+            api_client: APIClient,
+            staff_user: AuthUser,
+            django_assert_max_num_queries: Callable,
+    ) -> None:
+        """
+        Test that staff users see all product_types with all fields.
+        """
+
+        api_client.force_authenticate(user=staff_user)  # force authenticated mechanism
+
+        with django_assert_max_num_queries(2):
+            response = api_client.get(reverse("product_types-list"), format="json")
+
+        assert response.status_code == HTTP_200_OK
+
+        assert len(response.data) == 5
+        for item in response.data:
+            assert "time_created" in item
+            assert "time_updated" in item
 
 
 @pytest.mark.django_db
 def test_create_product_types_staff(
         api_client: APIClient,
         create_product_type: factory.django.DjangoModelFactory,
-        create_user: Callable,
+        staff_user: AuthUser,
 ) -> None:
     """
     Test that staff users can create a ProductType.
     """
 
-    user = create_user(is_staff=True)
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=staff_user)
 
     data: dict[str, str | bool] = {
         "name": "Staff ProductType",
@@ -1335,19 +913,18 @@ def test_create_product_types_staff(
     response = api_client.post(reverse("product_types-list"), data, format="multipart")
 
     assert response.status_code == HTTP_201_CREATED
-    assert ProductType.objects.filter(name="Staff ProductType").exists()
+    assert response.data["name"] == "Staff ProductType"
 
 
 @pytest.mark.django_db
 def test_create_product_types_non_staff(
-        api_client: APIClient, create_user: Callable
+        api_client: APIClient, regular_user: AuthUser
 ) -> None:
     """
     Test ensure that non-staff users cannot create a product types.
     """
 
-    user = create_user(is_staff=False)
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=regular_user)
 
     data: dict[str, str | bool] = {
         "name": "Non staff Product Type",
@@ -1361,7 +938,6 @@ def test_create_product_types_non_staff(
     assert not ProductType.objects.filter(name="Non staff Product Type").exists()
 
 
-@pytest.mark.django_db
 def test_create_product_types_anonymous(api_client: APIClient) -> None:
     """
     Test ensure that anonymous users cannot create a product type.
@@ -1376,21 +952,19 @@ def test_create_product_types_anonymous(api_client: APIClient) -> None:
 
     response = api_client.post(reverse("product_types-list"), data, format="multipart")
     assert response.status_code == HTTP_401_UNAUTHORIZED
-    assert not ProductType.objects.filter(name="Non staff Product Type").exists()
 
 
 @pytest.mark.django_db
 def test_update_product_types_staff(
         api_client: APIClient,
-        create_user: Callable,
+        staff_user: AuthUser,
         create_product_type: factory.django.DjangoModelFactory,
 ) -> None:
     """
     Test that a staff user can successfully update a product type instance
     """
 
-    user = create_user(is_staff=True)
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=staff_user)
 
     product_type = create_product_type.create(is_active=True)
     updated_data = {"name": "Updated_product_type"}
@@ -1408,15 +982,14 @@ def test_update_product_types_staff(
 @pytest.mark.django_db
 def test_update_product_types_non_staff(
         api_client: APIClient,
-        create_user: Callable,
+        regular_user: AuthUser,
         create_product_type: factory.django.DjangoModelFactory,
 ) -> None:
     """
     Test ensure that non staff users cannot update a product type.
     """
 
-    user = create_user()
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=regular_user)
 
     product_type = create_product_type.create(is_active=True)
     initial_name = product_type.name
@@ -1463,15 +1036,14 @@ def test_update_product_types_anonymous(
 @pytest.mark.django_db
 def test_delete_product_types_staff(
         api_client: APIClient,
-        create_user: Callable,
+        staff_user: AuthUser,
         create_product_type: factory.django.DjangoModelFactory,
 ) -> None:
     """
     Test that staff users can delete a vendor.
     """
 
-    user = create_user(is_staff=True)
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=staff_user)
 
     product_type = create_product_type.create()
 
@@ -1486,15 +1058,14 @@ def test_delete_product_types_staff(
 @pytest.mark.django_db
 def test_delete_product_types_non_staff(
         api_client: APIClient,
-        create_user: Callable,
+        regular_user: AuthUser,
         create_product_type: factory.django.DjangoModelFactory,
 ) -> None:
     """
     Test ensure that non staff users cannot delete a vendor.
     """
 
-    user = create_user()
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=regular_user)
 
     product_type = create_product_type.create()
 
@@ -1532,20 +1103,17 @@ def test_product_types_ordering(
     Test that vendors objects are returned in the correct ordering.
     """
 
-    create_product_type.create(ordering=3, is_active=True)
-    create_product_type.create(ordering=1, is_active=True)
-    create_product_type.create(ordering=5, is_active=True)
-    create_product_type.create(ordering=2, is_active=True)
-    create_product_type.create(ordering=4, is_active=True)
+    bulk_make(
+        create_product_type, 5, ordering=factory.Iterator([3, 1, 5, 2, 4]), is_active=True
+    )
 
     response = api_client.get(reverse("product_types-list"))
 
     assert response.status_code == HTTP_200_OK
 
-    returned_order = [item["ordering"] for item in response.data]
-    expected_order = sorted(returned_order)
+    returned_order = list(map(itemgetter("ordering"), response.data))
 
-    assert returned_order == expected_order
+    assert all(a <= b for a, b in pairwise(returned_order))
 
 
 # Testing Products
@@ -1563,9 +1131,9 @@ def test_get_product_anonymous(
     Test that anonymous users see only active product without restricted fields.
     """
     category = create_category.create()
-    industry = create_industry.create_batch(2)
+    industry = bulk_make(create_industry, 2)
     vendor = create_vendor.create()
-    product_type = create_product_type.create_batch(2)
+    product_type = bulk_make(create_product_type, 2)
 
     product_active = create_product.create_batch(
         3, category=category, vendor=vendor, is_active=True
@@ -1612,16 +1180,16 @@ def test_get_product_non_staff(
         create_vendor: factory.django.DjangoModelFactory,
         create_product_type: factory.django.DjangoModelFactory,
         create_extra_image: factory.django.DjangoModelFactory,
-        create_user: Callable,
+        regular_user: AuthUser,
 ) -> None:
     """
     Test that non_staff users see only active product without restricted fields.
     """
 
     category = create_category.create()
-    industry = create_industry.create_batch(2)
+    industry = bulk_make(create_industry, 2)
     vendor = create_vendor.create()
-    product_type = create_product_type.create_batch(2)
+    product_type = bulk_make(create_product_type, 2)
 
     product_active = create_product.create_batch(
         3, category=category, vendor=vendor, is_active=True
@@ -1645,8 +1213,7 @@ def test_get_product_non_staff(
 
         create_extra_image.create_batch(2, product=product)
 
-    user = create_user()
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=regular_user)
 
     response = api_client.get(reverse("products-list"), format="json")
     assert response.status_code == HTTP_200_OK
@@ -1671,16 +1238,16 @@ def test_get_product_staff(
         create_vendor: factory.django.DjangoModelFactory,
         create_product_type: factory.django.DjangoModelFactory,
         create_extra_image: factory.django.DjangoModelFactory,
-        create_user: Callable,
+        staff_user: AuthUser,
 ) -> None:
     """
     Test that staff users see all products with all fields.
     """
 
     category = create_category.create()
-    industry = create_industry.create_batch(2)
+    industry = bulk_make(create_industry, 2)
     vendor = create_vendor.create()
-    product_type = create_product_type.create_batch(2)
+    product_type = bulk_make(create_product_type, 2)
 
     product_active = create_product.create_batch(
         3, category=category, vendor=vendor, is_active=True
@@ -1704,8 +1271,7 @@ def test_get_product_staff(
 
         create_extra_image.create_batch(2, product=product)
 
-    user = create_user(is_staff=True)
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=staff_user)
 
     response = api_client.get(reverse("products-list"), format="json")
     assert response.status_code == HTTP_200_OK
@@ -1729,11 +1295,10 @@ def test_create_product_staff(
         create_vendor: factory.django.DjangoModelFactory,
         create_product_type: factory.django.DjangoModelFactory,
         create_extra_image: factory.django.DjangoModelFactory,
-        create_user: Callable,
+        staff_user: AuthUser,
         test_image: Callable,
 ) -> None:
-    user = create_user(is_staff=True)
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=staff_user)
 
     category = create_category.create()
     industry = create_industry.create()
@@ -1781,11 +1346,10 @@ def test_create_invalid_product_staff(
         create_vendor: factory.django.DjangoModelFactory,
         create_product_type: factory.django.DjangoModelFactory,
         create_extra_image: factory.django.DjangoModelFactory,
-        create_user: Callable,
+        staff_user: AuthUser,
         test_image: Callable,
 ) -> None:
-    user = create_user(is_staff=True)
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=staff_user)
 
     category = create_category.create()
     industry = create_industry.create()
@@ -1820,15 +1384,14 @@ def test_create_product_non_staff(
         create_vendor: factory.django.DjangoModelFactory,
         create_product_type: factory.django.DjangoModelFactory,
         create_extra_image: factory.django.DjangoModelFactory,
-        create_user: Callable,
+        regular_user: AuthUser,
         test_image: Callable,
 ) -> None:
     """
     Test ensure that non-staff users cannot create a product.
     """
 
-    user = create_user(is_staff=False)
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=regular_user)
 
     category = create_category.create()
     industry = create_industry.create()
@@ -1901,20 +1464,19 @@ def test_update_product_staff(
         create_vendor: factory.django.DjangoModelFactory,
         create_product_type: factory.django.DjangoModelFactory,
         create_extra_image: factory.django.DjangoModelFactory,
-        create_user: Callable,
+        staff_user: AuthUser,
         test_image: Callable,
 ) -> None:
     """
     Test that a staff user can successfully update a product instance
     """
 
-    user = create_user(is_staff=True)
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=staff_user)
 
     category = create_category.create()
-    industry = create_industry.create_batch(2)
+    industry = bulk_make(create_industry, 2)
     vendor = create_vendor.create()
-    product_type = create_product_type.create_batch(2)
+    product_type = bulk_make(create_product_type, 2)
 
     product = create_product.create(category=category, vendor=vendor, is_active=True)
 
@@ -1947,19 +1509,18 @@ def test_update_products_non_staff(
         create_vendor: factory.django.DjangoModelFactory,
         create_product_type: factory.django.DjangoModelFactory,
         create_extra_image: factory.django.DjangoModelFactory,
-        create_user: Callable,
+        regular_user: AuthUser,
 ) -> None:
     """
     Test ensure that non_staff users cannot update a product.
     """
 
-    user = create_user()
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=regular_user)
 
     category = create_category.create()
-    industry = create_industry.create_batch(2)
+    industry = bulk_make(create_industry, 2)
     vendor = create_vendor.create()
-    product_type = create_product_type.create_batch(2)
+    product_type = bulk_make(create_product_type, 2)
 
     product = create_product.create(category=category, vendor=vendor, is_active=True)
 
@@ -1992,9 +1553,9 @@ def test_update_products_anonymous(
     """
 
     category = create_category.create()
-    industry = create_industry.create_batch(2)
+    industry = bulk_make(create_industry, 2)
     vendor = create_vendor.create()
-    product_type = create_product_type.create_batch(2)
+    product_type = bulk_make(create_product_type, 2)
 
     product = create_product.create(category=category, vendor=vendor, is_active=True)
 
@@ -2022,19 +1583,18 @@ def test_delete_product_staff(
         create_vendor: factory.django.DjangoModelFactory,
         create_product_type: factory.django.DjangoModelFactory,
         create_extra_image: factory.django.DjangoModelFactory,
-        create_user: Callable,
+        staff_user: AuthUser,
 ) -> None:
     """
     Test that staff users can delete a product.
     """
 
-    user = create_user(is_staff=True)
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=staff_user)
 
     category = create_category.create()
-    industry = create_industry.create_batch(2)
+    industry = bulk_make(create_industry, 2)
     vendor = create_vendor.create()
-    product_type = create_product_type.create_batch(2)
+    product_type = bulk_make(create_product_type, 2)
 
     product = create_product.create(category=category, vendor=vendor, is_active=True)
 
@@ -2057,19 +1617,18 @@ def test_delete_product_non_staff(
         create_vendor: factory.django.DjangoModelFactory,
         create_product_type: factory.django.DjangoModelFactory,
         create_extra_image: factory.django.DjangoModelFactory,
-        create_user: Callable,
+        regular_user: AuthUser,
 ) -> None:
     """
     Test that non_staff users cannot delete a product.
     """
 
-    user = create_user()
-    api_client.force_authenticate(user=user)
+    api_client.force_authenticate(user=regular_user)
 
     category = create_category.create()
-    industry = create_industry.create_batch(2)
+    industry = bulk_make(create_industry, 2)
     vendor = create_vendor.create()
-    product_type = create_product_type.create_batch(2)
+    product_type = bulk_make(create_product_type, 2)
 
     product = create_product.create(category=category, vendor=vendor, is_active=True)
 
@@ -2084,7 +1643,7 @@ def test_delete_product_non_staff(
 
 
 @pytest.mark.django_db
-def test_delete_product_non_staff(
+def test_delete_product_anonymous(
         api_client: APIClient,
         create_product: factory.django.DjangoModelFactory,
         create_category: factory.django.DjangoModelFactory,
@@ -2098,9 +1657,9 @@ def test_delete_product_non_staff(
     """
 
     category = create_category.create()
-    industry = create_industry.create_batch(2)
+    industry = bulk_make(create_industry, 2)
     vendor = create_vendor.create()
-    product_type = create_product_type.create_batch(2)
+    product_type = bulk_make(create_product_type, 2)
 
     product = create_product.create(category=category, vendor=vendor, is_active=True)
 
@@ -2256,6 +1815,97 @@ def test_filter_products(
     assert response.data["count"] == 2
 
 
+@pytest.mark.django_db
+def test_filter_by_related_ids_checks_activity_in_main_query(
+        api_client: APIClient,
+        django_assert_num_queries: Callable,
+        create_product: factory.django.DjangoModelFactory,
+        create_category: factory.django.DjangoModelFactory,
+        create_industry: factory.django.DjangoModelFactory,
+        create_vendor: factory.django.DjangoModelFactory,
+        create_product_type: factory.django.DjangoModelFactory,
+) -> None:
+    """
+    Ensure that vendor, industry and product type ids are not validated with
+    separate queries, and that inactive related objects match nothing.
+    A single unknown or inactive id empties the result, even next to valid ones.
+    """
+
+    category = create_category.create()
+    vendor = create_vendor.create()
+    inactive_vendor = create_vendor.create(is_active=False)
+    industry = create_industry.create()
+    product_type = create_product_type.create()
+
+    product = create_product.create(category=category, vendor=vendor, is_active=True)
+    product.industry.set([industry])
+    product.product_type.set([product_type])
+    create_product.create(category=category, vendor=inactive_vendor, is_active=True)
+
+    params = {
+        "vendor": vendor.id,
+        "industry": industry.id,
+        "product_type": product_type.id,
+    }
+    # count, page, then industries, product types and images
+    with django_assert_num_queries(5):
+        response = api_client.get(reverse("products-list"), params)
+
+    assert response.status_code == HTTP_200_OK
+    assert [item["id"] for item in response.data["results"]] == [product.id]
+
+    response = api_client.get(reverse("products-list"), {"vendor": inactive_vendor.id})
+    assert response.status_code == HTTP_200_OK
+    assert response.data["results"] == []
+
+    response = api_client.get(reverse("products-list"), {"vendor": "abc"})
+    assert response.status_code == HTTP_200_OK
+    assert response.data["results"] == []
+
+    for mixed_params in (
+        {"vendor": [vendor.id, inactive_vendor.id]},
+        {"vendor": [vendor.id, inactive_vendor.id + 1000]},
+        {"industry": [industry.id, industry.id + 1000]},
+    ):
+        response = api_client.get(reverse("products-list"), mixed_params)
+        assert response.status_code == HTTP_200_OK
+        assert response.data["results"] == []
+
+    response = api_client.get(reverse("products-list"), {"vendor": [vendor.id] * 2})
+    assert [item["id"] for item in response.data["results"]] == [product.id]
+
+
+@pytest.mark.django_db
+def test_product_list_omits_descriptions_detail_keeps_them(
+        api_client: APIClient,
+        create_product: factory.django.DjangoModelFactory,
+        create_category: factory.django.DjangoModelFactory,
+        create_vendor: factory.django.DjangoModelFactory,
+) -> None:
+    """
+    Ensure that product lists leave out description and generated_description,
+    while the product detail still returns them.
+    """
+
+    product = create_product.create(
+        category=create_category.create(),
+        vendor=create_vendor.create(),
+        description="Long description",
+        is_active=True,
+    )
+
+    response = api_client.get(reverse("products-list"))
+    assert response.status_code == HTTP_200_OK
+    item = response.data["results"][0]
+    assert "description" not in item
+    assert "generated_description" not in item
+
+    response = api_client.get(reverse("products-detail", args=[product.id]))
+    assert response.status_code == HTTP_200_OK
+    assert response.data["description"] == "Long description"
+    assert "generated_description" in response.data
+
+
 @pytest.mark.django_db
 def test_filter_non_existent_values(
         api_client: APIClient,
@@ -2406,6 +2056,45 @@ def test_get_reviews_anonymous(
     assert response.data["count"] == 1
 
 
+@pytest.mark.django_db
+def test_get_reviews_query_count_does_not_grow_with_reviews(
+        api_client: APIClient,
+        django_assert_num_queries: Callable,
+        create_user: Callable,
+        create_product: factory.django.DjangoModelFactory,
+        create_category: factory.django.DjangoModelFactory,
+        create_vendor: factory.django.DjangoModelFactory,
+        create_review: factory.django.DjangoModelFactory,
+        create_review_reply: factory.django.DjangoModelFactory,
+) -> None:
+    """
+    Test that the review list loads reviewers and replies in bulk:
+    count, reviews with their users and replies are three queries in total.
+    """
+
+    staff = create_user(email="staff@example.com", is_staff=True)
+    category = create_category.create()
+    vendor = create_vendor.create()
+
+    for i in range(3):
+        product = create_product.create(
+            category=category, vendor=vendor, is_active=True
+        )
+        user = create_user(email=f"reviewer_{i}@example.com")
+        review = create_review.create(product=product, user=user, moderated=True)
+        create_review_reply.create(review=review, user=staff)
+
+    with django_assert_num_queries(3):
+        response = api_client.get(reverse("reviews-list"), format="json")
+
+    assert response.status_code == HTTP_200_OK
+    assert response.data["count"] == 3
+    for review in response.data["results"]:
+        assert review["user"].startswith("reviewer_")
+        assert review["time_updated"]
+        assert [reply["user"] for reply in review["replies"]] == [staff.id]
+
+
 @pytest.mark.django_db
 def test_get_reviews_non_staff(
         api_client: APIClient,
@@ -2588,7 +2277,7 @@ def test_create_review_anonymous(
 @pytest.mark.django_db
 def test_create_review_non_staff(
         api_client: APIClient,
-        create_user: Callable,
+        regular_user: AuthUser,
         create_product: factory.django.DjangoModelFactory,
         create_category: factory.django.DjangoModelFactory,
         create_industry: factory.django.DjangoModelFactory,
@@ -2615,8 +2304,7 @@ def test_create_review_non_staff(
     )
     product.save()
 
-    user = create_user()
-    api_client.force_authenticate(user)
+    api_client.force_authenticate(regular_user)
 
     data = {
         "product": product.id,
@@ -2630,14 +2318,14 @@ def test_create_review_non_staff(
     response = api_client.post(reverse("reviews-list"), data)
 
     assert response.status_code == HTTP_201_CREATED
-    assert Review.objects.filter(comment="Good product")
-    assert response.data["user"] == user.email
+    assert response.data["comment"] == "Good product"
+    assert response.data["user"] == regular_user.email
 
 
 @pytest.mark.django_db
 def test_user_cannot_create_duplicate_review(
         api_client: APIClient,
-        create_user: Callable,
+        regular_user: AuthUser,
         create_product: factory.django.DjangoModelFactory,
         create_category: factory.django.DjangoModelFactory,
         create_industry: factory.django.DjangoModelFactory,
@@ -2668,8 +2356,7 @@ def test_user_cannot_create_duplicate_review(
     )
     product.save()
 
-    user = create_user()
-    api_client.force_authenticate(user)
+    api_client.force_authenticate(regular_user)
 
     data = {
         "product": product.id,
@@ -9,6 +9,9 @@ from django.conf import settings
 
 logger = logging.getLogger("project")
 
+SHORT_DESCRIPTION_LENGTH = 50
+
+
 def render_image_preview(obj: Any) -> str:
     """
     Returns an HTML-safe <img> tag for displaying an image preview in the Django admin.
@@ -37,9 +40,16 @@ def render_image_preview(obj: Any) -> str:
 def short_description(obj: Any) -> str:
     """
     Returns a shortened version of the description field for the admin list view.
+    Prefers the `description_preview` annotation of the admin changelist,
+    which holds just enough characters to decide on the ellipsis.
     """
-    if obj.description:
-        return obj.description[:50] + ("..." if len(obj.description) > 50 else "")
+    description = getattr(obj, "description_preview", None)
+    if description is None:
+        description = obj.description
+    if description:
+        return description[:SHORT_DESCRIPTION_LENGTH] + (
+            "..." if len(description) > SHORT_DESCRIPTION_LENGTH else ""
+        )
     return "No description"
 
 
@@ -1,4 +1,4 @@
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from django.db.models import Prefetch, Q
 from django.db.models.query import QuerySet
 from rest_framework import mixins, viewsets
@@ -6,16 +6,19 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.serializers import BaseSerializer
+from rest_framework.settings import api_settings
 
 from store.filters import ProductFilter, SafeDjangoFilterBackend
 from store.mixins import IsActiveQuerysetMixin
 from store.permissions import IsStaffOrReadOnly, ReviewPermission
 
-from .models import (Carousel, Category, Industry, Product, ProductImages,
-                     ProductType, Review, ReviewReply, Vendor)
+from .models import (Carousel, Category, Industry, Product, ProductType,
+                     Review, ReviewReply, Vendor)
 from .serializers import (CarouselSerializer, CategorySerializer,
                           IndustrySerializer, ProductSerializer,
-                          ProductTypeSerializer, ReviewSerializer,
+                          ProductTypeSerializer, PublicProductListSerializer,
+                          PublicProductSerializer, ReviewSerializer,
+                          StaffProductListSerializer, StaffProductSerializer,
                           VendorSerializer)
 
 
@@ -62,7 +65,7 @@ class CategoryViewSet(
         user = self.request.user
 
         base_queryset = self.queryset.filter(parent__isnull=True)
-        if not (user.is_authenticated and user.is_staff):
+        if user.is_anonymous or not user.is_staff:
             base_queryset = base_queryset.filter(is_active=True)
 
         # Загружаем всех потомков всех уровней одним Prefetch
@@ -136,6 +139,7 @@ class ProductPagination(PageNumberPagination):
 
 
 class ProductViewSet(
+    IsActiveQuerysetMixin,
     mixins.CreateModelMixin,
     mixins.UpdateModelMixin,
     mixins.DestroyModelMixin,
@@ -150,12 +154,13 @@ class ProductViewSet(
     and ordering by price or custom ordering field. Applies pagination and
     permission control for staff-only modifications.
 
-    The queryset includes related category, vendor, industry, product type,
-    and prefetched product images for performance optimization.
+    Related category, vendor, industry, product type and product images are
+    loaded by ProductSerializer.setup_eager_loading().
 
     Returns only active products for unauthenticated or non-staff users.
     """
 
+    queryset = Product.objects.all()
     serializer_class = ProductSerializer
     filter_backends = [SafeDjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_class = ProductFilter
@@ -164,34 +169,19 @@ class ProductViewSet(
     permission_classes = [IsStaffOrReadOnly]
     pagination_class = ProductPagination
 
-    def get_queryset(self) -> QuerySet:
+    def get_serializer_class(self) -> type[ProductSerializer]:
         """
-        Returns the queryset of products with related data optimized using
-        select_related and prefetch_related. Filters out inactive products
-        for non-staff or unauthenticated users.
+        Staff and customers see differently shaped products; the shape is
+        known from the user and the action alone, so each has its own
+        serializer class. Lists leave out the long description columns.
         """
-        user = self.request.user
-
-        queryset = (
-            Product.objects.all()
-            .select_related("category", "vendor")
-            .prefetch_related(
-                Prefetch("industry", queryset=Industry.objects.only("id", "name")),
-                Prefetch(
-                    "product_type", queryset=ProductType.objects.only("id", "name")
-                ),
-                Prefetch(
-                    "productimages_set",
-                    queryset=ProductImages.objects.all(),
-                    to_attr="prefetched_images",
-                ),
-            )
-        )
-
-        if not (user.is_authenticated and user.is_staff):
-            return queryset.filter(is_active=True)
-
-        return queryset
+        if self.request.user.is_staff:
+            if self.action == "list":
+                return StaffProductListSerializer
+            return StaffProductSerializer
+        if self.action == "list":
+            return PublicProductListSerializer
+        return PublicProductSerializer
 
     def perform_create(self, serializer: BaseSerializer) -> None:
         """
@@ -284,7 +274,7 @@ class ReviewViewSet(
         Returns a queryset of reviews with optimized related data loading.
 
         - Filters by product ID if provided via query parameters.
-        - Prefetches replies and loads user relationships efficiently.
+        - Joins only the reviewer's email and prefetches all replies in one query.
         - Non-staff authenticated users see moderated reviews and their own unmoderated ones.
         - Anonymous users see only moderated reviews.
         - Staff users see all reviews.
@@ -294,17 +284,30 @@ class ReviewViewSet(
             Review.objects.all()
             .select_related("user")
             .prefetch_related(
-                Prefetch("replies", queryset=ReviewReply.objects.select_related("user"))
+                # replies serialize only user_id, so the user is not joined
+                Prefetch(
+                    "replies",
+                    queryset=ReviewReply.objects.only(
+                        "id",
+                        "review",
+                        "user",
+                        "comment",
+                        "time_created",
+                        "time_updated",
+                    ),
+                )
             )
             .only(
                 "id",
-                "user",
+                "user__email",
                 "product",
                 "rating",
                 "advantages",
                 "disadvantages",
                 "comment",
+                "moderated",
                 "time_created",
+                "time_updated",
             )
         )
 
@@ -322,12 +325,20 @@ class ReviewViewSet(
     def perform_create(self, serializer: BaseSerializer) -> None:
         """
         Handles creation of a review, associating it with the authenticated user.
+        Duplicates are rejected by the unique (user, product) constraint rather
+        than a separate lookup before the insert.
         Raises:
             ValidationError: If the user has already submitted a review for the same product.
         """
         try:
-            serializer.save(user=self.request.user)
+            # savepoint, so a rejected insert does not abort an outer transaction
+            with transaction.atomic():
+                serializer.save(user=self.request.user)
         except IntegrityError:
             raise ValidationError(
-                {"error": "You have already left a review for this product."}
+                {
+                    api_settings.NON_FIELD_ERRORS_KEY: [
+                        "You have already left a review for this product."
+                    ]
+                }
             )
@@ -4,17 +4,10 @@ import pytest
 from django.contrib.auth.tokens import default_token_generator
 from django.core import mail
 from djoser.utils import encode_uid
-from rest_framework.test import APIClient
 
 from ..models import AuthUser
 
 
-@pytest.fixture
-def api_client() -> APIClient:
-    """Api client fixture"""
-    return APIClient()
-
-
 @pytest.fixture
 def create_user() -> Callable[..., AuthUser]:
     """Fixture for creating a new user"""